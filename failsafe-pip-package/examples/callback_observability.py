@@ -8,6 +8,7 @@ Usage:
 """
 
 import asyncio
+from datetime import datetime, timezone
 
 from failsafe import FailSafe
 from failsafe.integrations.langchain.callback import FailSafeCallbackHandler
@@ -69,7 +70,9 @@ async def main():
             details = f" chain={entry['chain']}"
         if "tool" in entry:
             details = f" tool={entry['tool']}"
-        print(f"  [{entry['timestamp']}] {event}{details}")
+        # Entries carry epoch nanoseconds; format them only for display
+        ts = datetime.fromtimestamp(entry["ts_ns"] / 1e9, tz=timezone.utc)
+        print(f"  [{ts.isoformat()}] {event}{details}")
 
     print(f"\n--- Violations detected: {len(handler.violations)} ---")
     if handler.violations:
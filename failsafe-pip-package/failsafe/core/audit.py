@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import logging
+import threading
+import weakref
 from datetime import datetime
 from typing import Any
 
@@ -11,6 +15,8 @@ import aiosqlite
 
 from failsafe.core.models import HandoffPayload, ValidationResult
 
+logger = logging.getLogger(__name__)
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS handoffs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -51,79 +57,290 @@ CREATE INDEX IF NOT EXISTS idx_violations_severity ON violations (severity);
 """
 
 
+_INSERT_HANDOFF = (
+    "INSERT INTO handoffs (source, target, payload_hash, trace_id, timestamp) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_INSERT_VALIDATION = (
+    "INSERT INTO validations (handoff_id, passed, contract_name, mode, duration_ms, timestamp) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_INSERT_VIOLATION = (
+    "INSERT INTO violations (validation_id, rule, severity, message, field, evidence) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+class _LoopConnection:
+    """The connection, cursor and lock an ``AuditLog`` keeps per event loop."""
+
+    __slots__ = ("lock", "db", "cursor", "closer", "flush_scheduled", "tasks")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.db: aiosqlite.Connection | None = None
+        self.cursor: aiosqlite.Cursor | None = None
+        self.closer: asyncio.Task | None = None
+        self.flush_scheduled = False
+        self.tasks: set[asyncio.Task] = set()
+
+    async def close(self) -> None:
+        async with self.lock:
+            if self.db is not None:
+                await self.db.close()
+                self.db = None
+                self.cursor = None
+
+
+# Keeps closer tasks alive; otherwise a task and its connection form an
+# unreachable cycle once the AuditLog is gone and get collected mid-wait.
+_closers: set[asyncio.Task] = set()
+
+
+async def _close_on_shutdown(log_ref: weakref.ref, conn: _LoopConnection) -> None:
+    # Parks until the loop shuts down (asyncio.run() cancels outstanding
+    # tasks before closing the loop), close() is called or the AuditLog is
+    # collected, then writes whatever is still buffered and closes cleanly.
+    # This is the only place a connection is flushed for the last time.
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        try:
+            log = log_ref()
+            if log is not None:
+                await log._flush(conn)
+        except Exception:
+            logger.exception(
+                "Audit log closed with %d record(s) that could not be written",
+                len(log._pending),
+            )
+        finally:
+            del log
+            await conn.close()
+
+
+def _release_connections(conns: weakref.WeakKeyDictionary) -> None:
+    # Finalizer for a collected AuditLog: wake each loop's closer task.
+    for loop, conn in list(conns.items()):
+        try:
+            loop.call_soon_threadsafe(conn.closer.cancel)
+        except RuntimeError:
+            pass  # Loop already closed; its closer ran at shutdown
+
+
 class AuditLog:
-    """Persistent audit log for all validations."""
+    """Persistent audit log for all validations.
+
+    Keeps one SQLite connection and cursor per event loop, so the aiosqlite
+    worker thread is started once rather than per operation. The dashboard
+    serves from its own thread and loop, so it gets its own connection.
 
-    def __init__(self, db_path: str = "failsafe_audit.db") -> None:
-        self._initialized = False
-        # For :memory: databases, use a temp file so all connections share the same db
-        if db_path == ":memory:":
+    ``enqueue()`` buffers records and writes them in the background, up to
+    ``batch_size`` per transaction or after ``flush_interval`` seconds.
+    The buffer is shared by all loops, so a read on any loop (e.g. the
+    dashboard's, or ``asyncio.run()`` after ``handoff_sync()``) writes
+    every buffered record first, and anything still
+    buffered is written when the loop shuts down or on ``close()``.
+    Failed writes are logged and the records kept for the next attempt,
+    up to ``max_pending`` of them; past that the oldest are dropped.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "failsafe_audit.db",
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        max_pending: int = 10_000,
+    ) -> None:
+        self._tmp = None
+        self._requested_memory = db_path == ":memory:"
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: list[tuple[tuple, tuple, list[tuple]]] = []
+        # Loops on other threads enqueue and flush too
+        self._pending_lock = threading.Lock()
+        self._conns: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopConnection
+        ] = weakref.WeakKeyDictionary()
+        weakref.finalize(self, _release_connections, self._conns)
+
+    def _connect(self) -> aiosqlite.Connection:
+        conn = aiosqlite.connect(self.db_path)
+        # The connection outlives any single call; don't let its worker thread
+        # keep the interpreter alive at exit. (aiosqlite < 0.20 made the
+        # connection itself the thread.)
+        getattr(conn, "_thread", conn).daemon = True
+        return conn
+
+    def _resolve_path(self) -> None:
+        # For :memory: databases, use a temp file so all connections share the same db.
+        # Created on first use so instances that never record don't allocate one.
+        if self._tmp is None and self._requested_memory:
             import tempfile
             self._tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
             self.db_path = self._tmp.name
-        else:
-            self._tmp = None
-            self.db_path = db_path
 
-    def _connect(self) -> aiosqlite.Connection:
-        return aiosqlite.connect(self.db_path)
+    def _loop_connection(self) -> _LoopConnection:
+        loop = asyncio.get_running_loop()
+        conn = self._conns.get(loop)
+        if conn is None:
+            conn = self._conns[loop] = _LoopConnection()
+            conn.closer = loop.create_task(
+                _close_on_shutdown(weakref.ref(self), conn)
+            )
+            _closers.add(conn.closer)
+            conn.closer.add_done_callback(_closers.discard)
+        return conn
 
-    async def _ensure_tables(self) -> None:
-        if self._initialized:
-            return
-        async with self._connect() as db:
+    async def _ensure_tables(self, conn: _LoopConnection) -> aiosqlite.Cursor:
+        """Open ``conn`` on first use. Caller must hold ``conn.lock``."""
+        if conn.db is None:
+            self._resolve_path()
+            db = await self._connect()
+            db.row_factory = aiosqlite.Row
+            await db.execute("PRAGMA journal_mode=WAL")
+            await db.execute("PRAGMA synchronous=NORMAL")
             await db.executescript(SCHEMA)
             await db.commit()
-        self._initialized = True
+            conn.cursor = await db.cursor()
+            conn.db = db
+        return conn.cursor
 
-    async def record(
-        self, handoff: HandoffPayload, result: ValidationResult
-    ) -> None:
-        await self._ensure_tables()
-        payload_hash = hashlib.sha256(
-            json.dumps(handoff.data, sort_keys=True, default=str).encode()
-        ).hexdigest()
+    async def _write_pending(self, conn: _LoopConnection) -> None:
+        """Write buffered records in one transaction. Caller must hold ``conn.lock``."""
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            cursor = await self._ensure_tables(conn)
+            for handoff_row, validation_row, violation_rows in batch:
+                await cursor.execute(_INSERT_HANDOFF, handoff_row)
+                await cursor.execute(
+                    _INSERT_VALIDATION, (cursor.lastrowid, *validation_row)
+                )
+                if violation_rows:
+                    validation_id = cursor.lastrowid
+                    await cursor.executemany(
+                        _INSERT_VIOLATION,
+                        [(validation_id, *row) for row in violation_rows],
+                    )
+            await conn.db.commit()
+        except BaseException:
+            # Keep the records for the next flush (or the final one), up to
+            # max_pending so a database that keeps failing can't grow this
+            # without bound.
+            with self._pending_lock:
+                self._pending[:0] = batch
+                overflow = len(self._pending) - self.max_pending
+                if overflow > 0:
+                    del self._pending[:overflow]
+            if overflow > 0:
+                logger.error(
+                    "Audit buffer over %d records; dropped the %d oldest",
+                    self.max_pending, overflow,
+                )
+            if conn.db is not None:
+                await conn.db.rollback()
+            raise
 
-        async with self._connect() as db:
-            cursor = await db.execute(
-                "INSERT INTO handoffs (source, target, payload_hash, trace_id, timestamp) VALUES (?, ?, ?, ?, ?)",
-                (
-                    handoff.source,
-                    handoff.target,
-                    payload_hash,
-                    handoff.trace_id,
-                    handoff.timestamp.isoformat(),
-                ),
+    async def _flush(self, conn: _LoopConnection) -> None:
+        if self._pending:
+            async with conn.lock:
+                await self._write_pending(conn)
+
+    async def _flush_later(self, conn: _LoopConnection, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+            if delay:
+                conn.flush_scheduled = False
+            await self._flush(conn)
+        except Exception:
+            # Don't surface in unrelated tasks; the records stay buffered.
+            logger.exception(
+                "Audit write to %s failed; %d record(s) kept for retry",
+                self.db_path, len(self._pending),
             )
-            handoff_id = cursor.lastrowid
 
-            cursor = await db.execute(
-                "INSERT INTO validations (handoff_id, passed, contract_name, mode, duration_ms, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+    def _spawn_flush(self, conn: _LoopConnection, delay: float) -> None:
+        task = asyncio.get_running_loop().create_task(self._flush_later(conn, delay))
+        conn.tasks.add(task)
+        task.add_done_callback(conn.tasks.discard)
+
+    async def _fetchall(self, sql: str, params: Any = ()) -> list[dict[str, Any]]:
+        conn = self._loop_connection()
+        async with conn.lock:
+            await self._write_pending(conn)
+            cursor = await self._ensure_tables(conn)
+            await cursor.execute(sql, params)
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def flush(self) -> None:
+        """Write everything buffered, whichever loop enqueued it."""
+        await self._flush(self._loop_connection())
+
+    async def close(self) -> None:
+        """Flush and close the current loop's connection. It is reopened on next use."""
+        conn = self._conns.pop(asyncio.get_running_loop(), None)
+        if conn is None:
+            return
+        conn.closer.cancel()
+        await asyncio.gather(conn.closer, return_exceptions=True)
+
+    def enqueue(self, handoff: HandoffPayload, result: ValidationResult) -> None:
+        """Buffer a record for writing in the background.
+
+        Must be called from a running event loop. Rows are built immediately,
+        so later changes to ``handoff.data`` don't affect what is stored.
+        """
+        payload_hash = hashlib.sha256(
+            json.dumps(handoff.data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        record = (
+            (
+                handoff.source,
+                handoff.target,
+                payload_hash,
+                handoff.trace_id,
+                handoff.timestamp.isoformat(),
+            ),
+            (
+                1 if result.passed else 0,
+                result.contract_name,
+                result.validation_mode,
+                result.duration_ms,
+                result.timestamp.isoformat(),
+            ),
+            [
                 (
-                    handoff_id,
-                    1 if result.passed else 0,
-                    result.contract_name,
-                    result.validation_mode,
-                    result.duration_ms,
-                    result.timestamp.isoformat(),
-                ),
-            )
-            validation_id = cursor.lastrowid
-
-            for v in result.violations:
-                await db.execute(
-                    "INSERT INTO violations (validation_id, rule, severity, message, field, evidence) VALUES (?, ?, ?, ?, ?, ?)",
-                    (
-                        validation_id,
-                        v.rule,
-                        v.severity,
-                        v.message,
-                        v.field,
-                        json.dumps(v.evidence, default=str),
-                    ),
+                    v.rule,
+                    v.severity,
+                    v.message,
+                    v.field,
+                    json.dumps(v.evidence, default=str),
                 )
+                for v in result.violations
+            ],
+        )
+        with self._pending_lock:
+            self._pending.append(record)
+            pending = len(self._pending)
+        conn = self._loop_connection()
+        if pending >= self.batch_size:
+            self._spawn_flush(conn, 0)
+        elif not conn.flush_scheduled:
+            conn.flush_scheduled = True
+            self._spawn_flush(conn, self.flush_interval)
 
-            await db.commit()
+    async def record(
+        self, handoff: HandoffPayload, result: ValidationResult
+    ) -> None:
+        """Write a record and wait for it to be committed."""
+        self.enqueue(handoff, result)
+        await self.flush()
 
     async def query(
         self,
@@ -134,7 +351,6 @@ class AuditLog:
         limit: int = 100,
         offset: int = 0,
     ) -> list[dict[str, Any]]:
-        await self._ensure_tables()
         conditions: list[str] = []
         params: list[Any] = []
 
@@ -154,42 +370,31 @@ class AuditLog:
         where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
         params.extend([limit, offset])
 
-        async with self._connect() as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                f"""
-                SELECT h.id as handoff_id, h.source, h.target, h.trace_id, h.timestamp,
-                       v.passed, v.contract_name, v.mode, v.duration_ms
-                FROM handoffs h
-                JOIN validations v ON v.handoff_id = h.id
-                {where}
-                ORDER BY h.timestamp DESC
-                LIMIT ? OFFSET ?
-                """,
-                params,
-            )
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        return await self._fetchall(
+            f"""
+            SELECT h.id as handoff_id, h.source, h.target, h.trace_id, h.timestamp,
+                   v.passed, v.contract_name, v.mode, v.duration_ms
+            FROM handoffs h
+            JOIN validations v ON v.handoff_id = h.id
+            {where}
+            ORDER BY h.timestamp DESC
+            LIMIT ? OFFSET ?
+            """,
+            params,
+        )
 
     async def get_violations(self, validation_id: int) -> list[dict[str, Any]]:
-        await self._ensure_tables()
-        async with self._connect() as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT * FROM violations WHERE validation_id = ?",
-                (validation_id,),
-            )
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        return await self._fetchall(
+            "SELECT * FROM violations WHERE validation_id = ?",
+            (validation_id,),
+        )
 
     async def export_report(
         self, start: datetime, end: datetime
     ) -> dict[str, Any]:
-        await self._ensure_tables()
-        async with self._connect() as db:
-            db.row_factory = aiosqlite.Row
-
-            cursor = await db.execute(
+        period = (start.isoformat(), end.isoformat())
+        summary = (
+            await self._fetchall(
                 """
                 SELECT COUNT(*) as total,
                        SUM(CASE WHEN v.passed = 1 THEN 1 ELSE 0 END) as passed,
@@ -199,26 +404,25 @@ class AuditLog:
                 JOIN validations v ON v.handoff_id = h.id
                 WHERE h.timestamp BETWEEN ? AND ?
                 """,
-                (start.isoformat(), end.isoformat()),
+                period,
             )
-            summary = dict(await cursor.fetchone())
+        )[0]
 
-            cursor = await db.execute(
-                """
-                SELECT viol.severity, COUNT(*) as count
-                FROM handoffs h
-                JOIN validations v ON v.handoff_id = h.id
-                JOIN violations viol ON viol.validation_id = v.id
-                WHERE h.timestamp BETWEEN ? AND ?
-                GROUP BY viol.severity
-                """,
-                (start.isoformat(), end.isoformat()),
-            )
-            severity_rows = await cursor.fetchall()
-            by_severity = {row["severity"]: row["count"] for row in severity_rows}
-
-            return {
-                "period": {"start": start.isoformat(), "end": end.isoformat()},
-                "summary": summary,
-                "violations_by_severity": by_severity,
-            }
+        severity_rows = await self._fetchall(
+            """
+            SELECT viol.severity, COUNT(*) as count
+            FROM handoffs h
+            JOIN validations v ON v.handoff_id = h.id
+            JOIN violations viol ON viol.validation_id = v.id
+            WHERE h.timestamp BETWEEN ? AND ?
+            GROUP BY viol.severity
+            """,
+            period,
+        )
+        by_severity = {row["severity"]: row["count"] for row in severity_rows}
+
+        return {
+            "period": {"start": period[0], "end": period[1]},
+            "summary": summary,
+            "violations_by_severity": by_severity,
+        }
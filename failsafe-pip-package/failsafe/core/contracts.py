@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from failsafe.core.models import Contract
 
 
@@ -11,10 +13,21 @@ class ContractRegistry:
     def __init__(self) -> None:
         self._contracts: dict[str, Contract] = {}
         self._by_pair: dict[tuple[str, str], Contract] = {}
+        self._dump_cache: list[dict[str, Any]] | None = None
+        # Contract._revision the dump cache was filled at
+        self._dumped_at = Contract._revision
 
     def register(self, contract: Contract) -> None:
+        previous = self._contracts.get(contract.name)
+        if previous is not None:
+            # Re-registering a name may move it to another pair; don't leave
+            # the old pair pointing at the replaced contract.
+            old_pair = (previous.source, previous.target)
+            if self._by_pair.get(old_pair) is previous:
+                del self._by_pair[old_pair]
         self._contracts[contract.name] = contract
         self._by_pair[(contract.source, contract.target)] = contract
+        self._dump_cache = None
 
     def get(self, source: str, target: str) -> Contract | None:
         return self._by_pair.get((source, target))
@@ -25,6 +38,13 @@ class ContractRegistry:
     def list_all(self) -> list[Contract]:
         return list(self._contracts.values())
 
+    def list_all_dumped(self) -> list[dict[str, Any]]:
+        """``model_dump()`` of every contract, cached until a contract changes."""
+        if self._dump_cache is None or self._dumped_at != Contract._revision:
+            self._dump_cache = [c.model_dump() for c in self._contracts.values()]
+            self._dumped_at = Contract._revision
+        return self._dump_cache
+
     def coverage_matrix(self) -> dict[str, dict[str, str]]:
         """Returns which agent pairs have contracts and which don't.
 
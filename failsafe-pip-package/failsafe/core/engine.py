@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import threading
 from datetime import datetime, timezone
 from functools import wraps
 from typing import Any, Literal
-from uuid import uuid4
 
 from failsafe.core.audit import AuditLog
 from failsafe.core.contracts import ContractRegistry
+from failsafe.core.ids import new_trace_id
 from failsafe.core.llm_judge import LLMJudge
+from failsafe.core.masking import mask_sensitive
 from failsafe.core.models import (
     AgentCard,
     Contract,
@@ -21,12 +24,64 @@ from failsafe.core.models import (
 )
 from failsafe.core.policy import PolicyEngine, PolicyPack
 from failsafe.core.registry import AgentRegistry
+from failsafe.core.serialization import dumps
 from failsafe.core.validator import DeterministicValidator
 from failsafe.dashboard.events import EventBus
 
+# contract() shorthand arguments -> (rule type, extra config), in rule order.
+_SHORTHAND_RULES: tuple[tuple[str, str, dict[str, tuple[str, ...]]], ...] = (
+    ("allow", "allow_fields", {}),
+    ("deny", "deny_fields", {"patterns": ("ssn", "credit_card")}),
+    ("require", "require_fields", {}),
+)
+
+_bg_loop: asyncio.AbstractEventLoop | None = None
+_bg_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop handoff_sync() runs on, starting it on first use."""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="failsafe-loop", daemon=True
+            ).start()
+            atexit.register(_stop_background_loop, loop)
+            _bg_loop = loop
+        return _bg_loop
+
+
+def _stop_background_loop(loop: asyncio.AbstractEventLoop) -> None:
+    # Cancel what's left on the loop the way asyncio.run() would, so audit
+    # connections write their buffered records and close before exit.
+    async def shutdown() -> None:
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    try:
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=5)
+    except Exception:
+        pass
+
+
+async def _none() -> None:
+    return None
+
 
 class FailSafe:
-    """Main FailSafe engine. Entry point for all operations."""
+    """Main FailSafe engine. Entry point for all operations.
+
+    Set ``offload_validation=True`` to run the deterministic validator and
+    policy engine in worker threads instead of on the event loop. Only
+    worth it when custom rules or policies are slow; it requires them to
+    be thread-safe. It also lets these stages overlap with a pending LLM
+    judge call.
+    """
 
     def __init__(
         self,
@@ -36,6 +91,8 @@ class FailSafe:
         dashboard: bool = False,
         dashboard_port: int = 8765,
         audit_db: str = "failsafe_audit.db",
+        event_history: bool = True,
+        offload_validation: bool = False,
     ):
         self.registry = AgentRegistry()
         self.contracts = ContractRegistry()
@@ -43,8 +100,9 @@ class FailSafe:
         self.llm_judge = LLMJudge(api_key=cerebras_api_key) if cerebras_api_key else None
         self.policy_engine = PolicyEngine()
         self.audit_log = AuditLog(db_path=audit_db)
-        self.event_bus = EventBus()
+        self.event_bus = EventBus(keep_history=event_history or dashboard)
         self.mode = mode
+        self.offload_validation = offload_validation
         self._dashboard_server = None
 
         if policy_pack:
@@ -67,8 +125,6 @@ class FailSafe:
     # --- Dashboard ---
 
     def _start_dashboard(self, port: int) -> None:
-        import threading
-
         import uvicorn
 
         from failsafe.dashboard.server import create_app
@@ -158,21 +214,13 @@ class FailSafe:
         extra_rules: list[dict[str, Any]],
     ) -> list[ContractRule]:
         rules: list[ContractRule] = []
-        if allow:
-            rules.append(
-                ContractRule(rule_type="allow_fields", config={"fields": allow})
-            )
-        if deny:
-            rules.append(
-                ContractRule(
-                    rule_type="deny_fields",
-                    config={"fields": deny, "patterns": ["ssn", "credit_card"]},
-                )
-            )
-        if require:
-            rules.append(
-                ContractRule(rule_type="require_fields", config={"fields": require})
-            )
+        shorthand = {"allow": allow, "deny": deny, "require": require}
+        for arg, rule_type, extra in _SHORTHAND_RULES:
+            fields = shorthand[arg]
+            if fields:
+                config: dict[str, Any] = {"fields": fields}
+                config.update((k, list(v)) for k, v in extra.items())
+                rules.append(ContractRule(rule_type=rule_type, config=config))
         for r in extra_rules:
             rule_type = r.pop("type", r.pop("rule_type", "field_value"))
             rules.append(ContractRule(rule_type=rule_type, config=r))
@@ -193,7 +241,7 @@ class FailSafe:
         Pipeline:
         1. Look up contract for source->target
         2. Run deterministic validation
-        3. If nl_rules exist, run LLM-as-judge
+        3. If nl_rules exist, run LLM-as-judge (concurrently with 2 and 4)
         4. Run policy engine
         5. Combine results
         6. Log to audit trail
@@ -205,7 +253,7 @@ class FailSafe:
             target=target,
             data=payload,
             timestamp=datetime.now(timezone.utc),
-            trace_id=trace_id or str(uuid4()),
+            trace_id=trace_id or new_trace_id(),
             metadata=metadata or {},
         )
 
@@ -213,24 +261,52 @@ class FailSafe:
         all_violations: list[Violation] = []
         validation_mode: Literal["deterministic", "llm", "both"] = "deterministic"
 
-        # Step 1: Deterministic validation
-        if contract:
-            det_result = self.validator.validate(handoff_payload, contract)
-            all_violations.extend(det_result.violations)
+        # Start the LLM judge first and give it a turn of the loop, so it is
+        # under way before the (synchronous) deterministic and policy stages.
+        llm_task = None
+        if contract and contract.nl_rules and self.llm_judge:
+            llm_task = asyncio.ensure_future(
+                self.llm_judge.submit(handoff_payload, contract.nl_rules)
+            )
+            await asyncio.sleep(0)
+
+        try:
+            if contract is None and not self.policy_engine.has_policies():
+                # Nothing to check on this edge: skip both stages (and the
+                # worker-thread round-trips when offloading).
+                det_result, policy_violations = None, []
+            elif self.offload_validation:
+                # Steps 1 and 3 in worker threads, so a busy loop (e.g. the
+                # dashboard's) keeps serving while they run.
+                det_result, policy_violations = await asyncio.gather(
+                    asyncio.to_thread(self.validator.validate, handoff_payload, contract)
+                    if contract else _none(),
+                    asyncio.to_thread(self.policy_engine.evaluate, handoff_payload),
+                )
+            else:
+                # Step 1: Deterministic validation
+                det_result = (
+                    self.validator.validate(handoff_payload, contract)
+                    if contract else None
+                )
+
+                # Step 3: Policy engine
+                policy_violations = self.policy_engine.evaluate(handoff_payload)
+            if det_result is not None:
+                all_violations.extend(det_result.violations)
+        except BaseException:
+            if llm_task:
+                llm_task.cancel()
+            raise
 
         # Step 2: LLM-as-judge
-        if contract and contract.nl_rules and self.llm_judge:
+        if llm_task:
             try:
-                llm_violations = await self.llm_judge.evaluate(
-                    handoff_payload, contract.nl_rules
-                )
-                all_violations.extend(llm_violations)
+                all_violations.extend(await llm_task)
                 validation_mode = "both" if contract.rules else "llm"
             except Exception:
                 pass  # LLM failure shouldn't block validation
 
-        # Step 3: Policy engine
-        policy_violations = self.policy_engine.evaluate(handoff_payload)
         all_violations.extend(policy_violations)
 
         # Step 4: Build result
@@ -249,27 +325,33 @@ class FailSafe:
 
         # Step 5: Audit log + dashboard event
         try:
-            await self.audit_log.record(handoff_payload, result)
+            self.audit_log.enqueue(handoff_payload, result)
         except Exception:
             pass
 
-        await self.event_bus.emit(
-            "validation",
-            {
-                "source": source,
-                "target": target,
-                "passed": result.passed,
-                "violations": [v.model_dump() for v in result.violations],
-                "contract": contract.name if contract else None,
-                "trace_id": handoff_payload.trace_id,
-                "timestamp": handoff_payload.timestamp.isoformat(),
-                "duration_ms": result.duration_ms,
-                "payload_keys": list(payload.keys()),
-                "payload_size": len(str(payload)),
-                "payload_preview": self._payload_preview(payload),
-                "payload": self._mask_sensitive(payload),
-            },
-        )
+        # Building the event (dumps, preview, masking) is the costliest part
+        # of a clean handoff; skip it when nothing would see it.
+        if self.event_bus.has_listeners():
+            raw = dumps(payload)
+            ts_iso = handoff_payload.timestamp.isoformat()
+            await self.event_bus.emit(
+                "validation",
+                {
+                    "source": source,
+                    "target": target,
+                    "passed": result.passed,
+                    "violations": [v.model_dump() for v in result.violations],
+                    "contract": contract.name if contract else None,
+                    "trace_id": handoff_payload.trace_id,
+                    "timestamp": ts_iso,
+                    "duration_ms": result.duration_ms,
+                    "payload_keys": list(payload),
+                    "payload_size": len(str(payload)),
+                    "payload_preview": self._payload_preview(raw),
+                    "payload": self._mask_sensitive(payload, raw),
+                },
+                timestamp=ts_iso,
+            )
 
         return result
 
@@ -290,77 +372,42 @@ class FailSafe:
         payload: dict[str, Any],
         **kwargs: Any,
     ) -> ValidationResult:
-        """Synchronous wrapper for handoff()."""
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop and loop.is_running():
-            import concurrent.futures
+        """Synchronous wrapper for handoff().
 
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(
-                    asyncio.run,
-                    self.handoff(source, target, payload, **kwargs),
-                )
-                return future.result()
-        return asyncio.run(self.handoff(source, target, payload, **kwargs))
-
-    def _payload_preview(self, payload: dict, max_length: int = 200) -> str:
-        """Create a short string preview of the payload for display."""
-        import json
-
-        text = json.dumps(payload, default=str)
-        if len(text) > max_length:
-            return text[:max_length] + "..."
-        return text
-
-    def _mask_sensitive(self, payload: dict) -> dict:
-        """Deep-copy payload with sensitive-looking values masked.
-
-        Masks values for keys matching common sensitive patterns.
-        Also masks string values that match SSN/credit card regex patterns.
-        Keeps structure and key names visible — only masks the VALUES.
+        Runs on a shared background event loop, so calls made from sync code
+        or from inside another running loop reuse one loop (and its audit
+        connection) instead of creating a new one each time.
         """
-        import re
+        loop = _background_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError(
+                "handoff_sync() can't be called from inside a handoff; await handoff() instead"
+            )
+        return asyncio.run_coroutine_threadsafe(
+            self.handoff(source, target, payload, **kwargs), loop
+        ).result()
 
-        sensitive_key_patterns = {
-            "ssn", "social_security", "password", "passwd", "secret",
-            "token", "api_key", "apikey", "credit_card", "card_number",
-            "account_number", "bank_account", "tax_id", "private_key",
-            "access_key", "secret_key",
-        }
+    def _payload_preview(self, raw: str, max_length: int = 200) -> str:
+        """Create a short preview of the payload's JSON text for display."""
+        if len(raw) > max_length:
+            return raw[:max_length] + "..."
+        return raw
 
-        ssn_re = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
-        cc_re = re.compile(r"\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b")
-
-        def _mask(data: Any) -> Any:
-            if isinstance(data, dict):
-                result = {}
-                for k, v in data.items():
-                    key_lower = k.lower().replace("-", "_")
-                    if key_lower in sensitive_key_patterns:
-                        result[k] = "***MASKED***"
-                    else:
-                        result[k] = _mask(v)
-                return result
-            elif isinstance(data, list):
-                return [_mask(item) for item in data]
-            elif isinstance(data, str):
-                masked = ssn_re.sub("***-**-****", data)
-                masked = cc_re.sub("****-****-****-****", masked)
-                return masked
-            return data
-
-        return _mask(payload)
+    def _mask_sensitive(self, payload: dict, raw: str | None = None) -> dict:
+        """Deep-copy payload with sensitive values masked; see ``mask_sensitive``."""
+        return mask_sensitive(payload, raw)
 
     def _sanitize(
         self, data: dict[str, Any], violations: list[Violation]
     ) -> dict[str, Any]:
-        sanitized = dict(data)
-        for v in violations:
-            if v.field:
-                for field_name in v.field.split(", "):
-                    sanitized.pop(field_name, None)
-        return sanitized
+        to_drop = {
+            field_name
+            for v in violations
+            if v.field
+            for field_name in v.field.split(", ")
+        }
+        return {k: v for k, v in data.items() if k not in to_drop}
@@ -0,0 +1,69 @@
+"""Trace ID generation."""
+
+from __future__ import annotations
+
+import itertools
+import os
+import time
+from uuid import UUID
+
+_RAND_MASK = (1 << 74) - 1
+_RAND_B_MASK = (1 << 62) - 1
+
+_seed = 0
+_counter = itertools.count()
+
+
+def _reseed() -> None:
+    """Pick a new random starting point for this process's IDs."""
+    global _seed, _counter
+    _seed = int.from_bytes(os.urandom(10), "big")
+    _counter = itertools.count()
+
+
+_reseed()
+
+# A forked child must not continue the parent's sequence.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed)
+
+
+def _random_bits() -> int:
+    """Next 74 "random" bits: a per-process random seed plus a counter.
+
+    RFC 9562's monotonic-random method: one urandom read per process, IDs
+    minted within the same millisecond still sort in creation order, and
+    next() on itertools.count is atomic, so no lock is needed.
+    """
+    return (_seed + next(_counter)) & _RAND_MASK
+
+
+def _uuid7_int() -> int:
+    ms = time.time_ns() // 1_000_000
+    rand = _random_bits()
+    # Version (0111) in bits 76-79, RFC 4122 variant (10) in bits 62-63.
+    return (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 62) << 64
+        | 0x2 << 62
+        | (rand & _RAND_B_MASK)
+    )
+
+
+def uuid7() -> UUID:
+    """Return a UUIDv7 (RFC 9562): 48-bit Unix ms timestamp + 74 random bits.
+
+    IDs minted later sort after earlier ones, so inserts into the
+    ``trace_id`` index land at its tail instead of at random pages.
+    """
+    return UUID(int=_uuid7_int())
+
+
+def new_trace_id() -> str:
+    """Return a fresh, time-ordered trace ID string (same text as ``str(uuid7())``)."""
+    ms = time.time_ns() // 1_000_000
+    rand = _random_bits()
+    t = f"{ms & 0xFFFF_FFFF_FFFF:012x}"
+    low = f"{rand & _RAND_B_MASK | 1 << 63:016x}"
+    return f"{t[:8]}-{t[8:]}-7{rand >> 62:03x}-{low[:4]}-{low[4:]}"
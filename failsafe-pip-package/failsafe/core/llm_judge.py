@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from typing import Any
@@ -28,6 +29,21 @@ Respond with ONLY valid JSON in this exact format:
   ]
 }"""
 
+BATCH_SYSTEM_PROMPT = """You are a compliance judge evaluating whether data passed between AI agents violates any rules.
+
+You will be given several numbered handoffs. Each has a payload of data being passed from one agent to another and its own list of natural language rules.
+
+For each handoff, evaluate every one of its rules independently of the other handoffs.
+
+Respond with ONLY valid JSON in this exact format:
+{
+  "results": [
+    {"index": <handoff number>, "evaluations": [
+      {"rule": "<rule text>", "passed": true/false, "reason": "<explanation>", "severity": "low|medium|high|critical"}
+    ]}
+  ]
+}"""
+
 
 class LLMJudge:
     """Evaluates natural language rules against handoff payloads using an LLM."""
@@ -37,10 +53,23 @@ class LLMJudge:
         api_url: str = DEFAULT_API_URL,
         api_key: str | None = None,
         model: str = DEFAULT_MODEL,
+        max_batch_size: int = 1,
+        max_latency_ms: float = 0.0,
     ):
         self.api_url = api_url
         self.api_key = api_key or os.environ.get("CEREBRAS_API_KEY")
         self.model = model
+        self.batcher = LLMJudgeBatcher(
+            self, max_batch_size=max_batch_size, max_latency_ms=max_latency_ms
+        )
+
+    async def submit(
+        self, payload: HandoffPayload, nl_rules: list[str]
+    ) -> list[Violation]:
+        """Like evaluate(), but coalesced with concurrent calls into one request."""
+        if not nl_rules or not self.api_key:
+            return []
+        return await self.batcher.submit(payload, nl_rules)
 
     async def evaluate(
         self, payload: HandoffPayload, nl_rules: list[str]
@@ -69,7 +98,34 @@ Rules to evaluate:
 
 Return your evaluation as JSON."""
 
-    async def _call_llm(self, prompt: str) -> dict[str, Any]:
+    def _build_batch_prompt(
+        self, items: list[tuple[HandoffPayload, list[str]]]
+    ) -> str:
+        sections = []
+        for index, (payload, nl_rules) in enumerate(items):
+            rules_text = "\n".join(f"  {i + 1}. {r}" for i, r in enumerate(nl_rules))
+            payload_text = json.dumps(payload.data, indent=2, default=str)
+            sections.append(
+                f"""Handoff {index}:
+Source agent: {payload.source}
+Target agent: {payload.target}
+
+Payload:
+{payload_text}
+
+Rules to evaluate:
+{rules_text}"""
+            )
+        body = "\n\n".join(sections)
+        return f"""Evaluate each of the following handoffs against its own rules:
+
+{body}
+
+Return your evaluation as JSON."""
+
+    async def _call_llm(
+        self, prompt: str, system_prompt: str = SYSTEM_PROMPT
+    ) -> dict[str, Any]:
         async with httpx.AsyncClient() as client:
             response = await client.post(
                 self.api_url,
@@ -80,7 +136,7 @@ Return your evaluation as JSON."""
                 json={
                     "model": self.model,
                     "messages": [
-                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "system", "content": system_prompt},
                         {"role": "user", "content": prompt},
                     ],
                     "temperature": 0,
@@ -113,3 +169,101 @@ Return your evaluation as JSON."""
                 )
 
         return violations
+
+
+class LLMJudgeBatcher:
+    """Coalesces concurrent ``LLMJudge`` evaluations into one chat completion.
+
+    Requests arriving within ``max_latency_ms`` of the first pending one are
+    packed into a single prompt, up to ``max_batch_size`` per call. A batch
+    of one goes through the regular ``evaluate()`` path, and handoffs missing
+    from a batched reply are re-evaluated on their own.
+
+    Batching is off by default (``max_batch_size=1``): every handoff is
+    judged in its own request, sent immediately. Raise ``max_batch_size``
+    and ``max_latency_ms`` to trade latency for fewer calls, bearing in mind
+    that batched handoffs share one prompt.
+    """
+
+    def __init__(
+        self,
+        judge: LLMJudge,
+        max_batch_size: int = 1,
+        max_latency_ms: float = 0.0,
+    ):
+        self.judge = judge
+        self.max_batch_size = max_batch_size
+        self.max_latency_ms = max_latency_ms
+        self._pending: dict[
+            asyncio.AbstractEventLoop,
+            list[tuple[HandoffPayload, list[str], asyncio.Future]],
+        ] = {}
+
+    async def submit(
+        self, payload: HandoffPayload, nl_rules: list[str]
+    ) -> list[Violation]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = self._pending[loop] = []
+        batch.append((payload, nl_rules, future))
+        if len(batch) >= self.max_batch_size:
+            self._dispatch(loop, batch)
+        elif len(batch) == 1:
+            loop.call_later(self.max_latency_ms / 1000, self._dispatch, loop, batch)
+        return await future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, batch: list) -> None:
+        # Called by the size trigger and by the timer; whichever runs second
+        # finds the batch already detached and does nothing.
+        if self._pending.get(loop) is not batch:
+            return
+        del self._pending[loop]
+        loop.create_task(self._run(batch))
+
+    async def _run(
+        self, batch: list[tuple[HandoffPayload, list[str], asyncio.Future]]
+    ) -> None:
+        if len(batch) == 1:
+            payload, nl_rules, future = batch[0]
+            await self._resolve(future, self.judge.evaluate(payload, nl_rules))
+            return
+
+        try:
+            prompt = self.judge._build_batch_prompt([(p, r) for p, r, _ in batch])
+            response = await self.judge._call_llm(prompt, BATCH_SYSTEM_PROMPT)
+            results = {
+                r.get("index"): r
+                for r in response.get("results", [])
+                if isinstance(r, dict)
+            }
+        except Exception as exc:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        retries = []
+        for index, (payload, nl_rules, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in results:
+                future.set_result(self.judge._parse_response(results[index], payload))
+            else:
+                retries.append(
+                    self._resolve(future, self.judge.evaluate(payload, nl_rules))
+                )
+        if retries:
+            await asyncio.gather(*retries)
+
+    @staticmethod
+    async def _resolve(future: asyncio.Future, coro) -> None:
+        try:
+            result = await coro
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,86 @@
+"""Masking of sensitive payload values before they reach the dashboard."""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+SENSITIVE_KEYS = frozenset({
+    "ssn", "social_security", "password", "passwd", "secret",
+    "token", "api_key", "apikey", "credit_card", "card_number",
+    "account_number", "bank_account", "tax_id", "private_key",
+    "access_key", "secret_key",
+})
+
+MASK = "***MASKED***"
+
+# SSNs and card numbers in one pass; _mask_match picks the mask by group.
+SENSITIVE_VALUE_RE = re.compile(
+    r"(?P<ssn>\b\d{3}-\d{2}-\d{4}\b)"
+    r"|(?P<cc>\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b)"
+)
+
+# Cheap reject for SENSITIVE_VALUE_RE: both patterns need digits, and a bare
+# \d search runs several times faster than the alternation on text without any.
+_HAS_DIGIT = re.compile(r"\d").search
+
+
+# Loose superset of what mask_sensitive() masks, run over the payload's JSON
+# text: any sensitive key followed by a colon, or the value patterns without
+# word boundaries (JSON escapes like "\n" would otherwise hide a boundary).
+# Only valid when the JSON has no \u escapes, so keys and digits appear
+# verbatim (case-insensitive matching covers non-ASCII case folding).
+SENSITIVE_SCREEN_RE = re.compile(
+    r'(?i)"(?:'
+    + "|".join(sorted(k.replace("_", "[-_]") for k in SENSITIVE_KEYS))
+    + r')"\s*:'
+    r"|\d{3}-\d{2}-\d{4}"
+    r"|\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}"
+)
+
+
+def _mask_match(m: re.Match) -> str:
+    return "***-**-****" if m.lastgroup == "ssn" else "****-****-****-****"
+
+
+def _mask(data: Any) -> Any:
+    # Builds new containers as it goes, so the input is never copied or
+    # mutated; scalars other than str are shared.
+    if isinstance(data, dict):
+        return {
+            k: MASK if k.lower().replace("-", "_") in SENSITIVE_KEYS else _mask(v)
+            for k, v in data.items()
+        }
+    elif isinstance(data, list):
+        return [_mask(item) for item in data]
+    elif isinstance(data, str):
+        if _HAS_DIGIT(data) is None:
+            return data
+        return SENSITIVE_VALUE_RE.sub(_mask_match, data)
+    return data
+
+
+def _copy(data: Any) -> Any:
+    # _mask() minus the checks: fresh containers, shared scalars.
+    if isinstance(data, dict):
+        return {k: _copy(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [_copy(item) for item in data]
+    return data
+
+
+def mask_sensitive(payload: dict, raw: str | None = None) -> dict:
+    """Deep-copy payload with sensitive-looking values masked.
+
+    Masks values for keys matching common sensitive patterns.
+    Also masks string values that match SSN/credit card regex patterns.
+    Keeps structure and key names visible — only masks the VALUES.
+
+    If ``raw`` (the payload's JSON text) is given and shows nothing
+    that could need masking, the containers are copied without checking
+    keys or values. They are still copied, so later changes to the
+    caller's payload can't reach the result.
+    """
+    if raw is not None and "\\u" not in raw and not SENSITIVE_SCREEN_RE.search(raw):
+        return _copy(payload)
+    return _mask(payload)
@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Callable, Literal
-from uuid import uuid4
-
+from datetime import datetime, timezone
+from typing import Any, Callable, ClassVar, Literal
 from pydantic import BaseModel, Field
 
+from failsafe.core.ids import new_trace_id
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class _RegisteredModel(BaseModel):
+    """Base for models kept in a registry.
+
+    Counts field assignments, so registries can tell that their cached
+    views may be stale. In-place edits of a field's list or dict are not
+    seen; assign a new value (or re-register) instead.
+    """
+
+    _revision: ClassVar[int] = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        _RegisteredModel._revision += 1
+
 
-class AgentCard(BaseModel):
+class AgentCard(_RegisteredModel):
     """Registered agent in the system."""
 
     name: str
@@ -29,7 +48,7 @@ class ContractRule(BaseModel):
     config: dict[str, Any] = Field(default_factory=dict)
 
 
-class Contract(BaseModel):
+class Contract(_RegisteredModel):
     """Handoff contract between two agents."""
 
     name: str
@@ -47,8 +66,8 @@ class HandoffPayload(BaseModel):
     source: str
     target: str
     data: dict[str, Any]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    trace_id: str = Field(default_factory=lambda: str(uuid4()))
+    timestamp: datetime = Field(default_factory=_utcnow)
+    trace_id: str = Field(default_factory=new_trace_id)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
@@ -72,5 +91,5 @@ class ValidationResult(BaseModel):
     sanitized_payload: dict[str, Any] | None = None
     contract_name: str = ""
     validation_mode: Literal["deterministic", "llm", "both"] = "deterministic"
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     duration_ms: float = 0.0
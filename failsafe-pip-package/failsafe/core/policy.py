@@ -32,19 +32,26 @@ class PolicyEngine:
 
     def __init__(self) -> None:
         self.packs: list[PolicyPack] = []
+        # (condition, check) of every loaded policy, in evaluation order.
+        self._checks: list[tuple[Callable, Callable]] = []
 
     def load_pack(self, pack: PolicyPack) -> None:
+        """Load a pack. Its policies are captured at load time."""
         self.packs.append(pack)
+        self._checks.extend((p.condition, p.check) for p in pack.policies)
+
+    def has_policies(self) -> bool:
+        """Whether evaluate() could return anything."""
+        return bool(self._checks)
 
     def evaluate(self, payload: HandoffPayload) -> list[Violation]:
         violations: list[Violation] = []
-        for pack in self.packs:
-            for policy in pack.policies:
-                try:
-                    if policy.condition(payload):
-                        result = policy.check(payload)
-                        if result:
-                            violations.append(result)
-                except Exception:
-                    pass
+        for condition, check in self._checks:
+            try:
+                if condition(payload):
+                    result = check(payload)
+                    if result:
+                        violations.append(result)
+            except Exception:
+                pass
         return violations
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from failsafe.core.models import AgentCard
 
 
@@ -10,9 +12,23 @@ class AgentRegistry:
 
     def __init__(self) -> None:
         self._agents: dict[str, AgentCard] = {}
+        self._dump_cache: list[dict[str, Any]] | None = None
+        self._authority_cache: dict[tuple[str, str], bool] = {}
+        # AgentCard._revision the caches were filled at
+        self._cached_at = AgentCard._revision
 
     def register(self, agent: AgentCard) -> None:
         self._agents[agent.name] = agent
+        self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        self._dump_cache = None
+        self._authority_cache.clear()
+        self._cached_at = AgentCard._revision
+
+    def _check_caches(self) -> None:
+        if self._cached_at != AgentCard._revision:
+            self._clear_caches()
 
     def get(self, name: str) -> AgentCard | None:
         return self._agents.get(name)
@@ -20,16 +36,34 @@ class AgentRegistry:
     def list_all(self) -> list[AgentCard]:
         return list(self._agents.values())
 
+    def list_all_dumped(self) -> list[dict[str, Any]]:
+        """``model_dump()`` of every agent, cached until an agent changes."""
+        self._check_caches()
+        if self._dump_cache is None:
+            self._dump_cache = [a.model_dump() for a in self._agents.values()]
+        return self._dump_cache
+
     def has_authority(self, agent_name: str, action: str) -> bool:
-        """Check if an agent has authority to perform an action."""
+        """Check if an agent has authority to perform an action.
+
+        Answers are cached per ``(agent_name, action)`` until an agent is
+        registered or has a field reassigned.
+        """
+        self._check_caches()
+        key = (agent_name, action)
+        try:
+            return self._authority_cache[key]
+        except KeyError:
+            pass
         agent = self._agents.get(agent_name)
         if agent is None:
-            return False
-        if action in agent.deny_authority:
-            return False
-        if agent.authority and action not in agent.authority:
-            return False
-        return True
+            allowed = False
+        elif action in agent.deny_authority:
+            allowed = False
+        else:
+            allowed = not agent.authority or action in agent.authority
+        self._authority_cache[key] = allowed
+        return allowed
 
     def can_access_field(self, agent_name: str, field: str) -> bool:
         """Check if an agent can access a data field."""
@@ -0,0 +1,27 @@
+"""JSON encoding for events and previews — uses orjson when installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Compact ``json.dumps(obj, default=str)`` equivalent.
+
+    Uses orjson when available; falls back to the stdlib for anything orjson
+    refuses (e.g. integers wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, default=str, separators=(",", ":"))
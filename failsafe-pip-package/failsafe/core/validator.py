@@ -35,6 +35,11 @@ def _flatten_keys(data: dict[str, Any], prefix: str = "") -> set[str]:
     return keys
 
 
+def _top_level_keys(data: dict[str, Any]) -> set[str]:
+    """Top-level keys as _flatten_keys() would report them (no dotted names)."""
+    return {k for k in data if "." not in k}
+
+
 def _flatten_values(data: dict[str, Any]) -> list[str]:
     """Recursively extract all string values from nested dicts."""
     values: list[str] = []
@@ -110,10 +115,8 @@ class DeterministicValidator:
         self, rule: ContractRule, payload: HandoffPayload
     ) -> Violation | None:
         allowed = set(rule.config.get("fields", []))
-        actual = _flatten_keys(payload.data)
         # Only check top-level keys for allow_fields
-        top_level = {k for k in actual if "." not in k}
-        extra = top_level - allowed
+        extra = _top_level_keys(payload.data) - allowed
         if extra:
             return Violation(
                 rule="allow_fields",
@@ -130,9 +133,12 @@ class DeterministicValidator:
         self, rule: ContractRule, payload: HandoffPayload
     ) -> Violation | None:
         denied = set(rule.config.get("fields", []))
-        actual = _flatten_keys(payload.data)
-
-        found = denied & actual
+        # Nested keys are only reachable through dotted names, so the full
+        # key walk is needed only when some denied name has a dot.
+        if any("." in name for name in denied):
+            found = denied & _flatten_keys(payload.data)
+        else:
+            found = denied & payload.data.keys()
         if found:
             return Violation(
                 rule="deny_fields",
@@ -146,28 +152,29 @@ class DeterministicValidator:
 
         # Also scan string values for denied field patterns
         if rule.config.get("scan_values", True):
-            denied_patterns = rule.config.get("patterns", [])
+            denied_patterns = [
+                name for name in rule.config.get("patterns", [])
+                if name in SENSITIVE_PATTERNS
+            ]
+            texts = _flatten_values(payload.data) if denied_patterns else []
             for pattern_name in denied_patterns:
-                if pattern_name in SENSITIVE_PATTERNS:
-                    for text in _flatten_values(payload.data):
-                        if SENSITIVE_PATTERNS[pattern_name].search(text):
-                            return Violation(
-                                rule="deny_fields",
-                                severity="critical",
-                                message=f"Sensitive pattern '{pattern_name}' found in payload text",
-                                evidence={"pattern": pattern_name},
-                                source_agent=payload.source,
-                                target_agent=payload.target,
-                            )
+                for text in texts:
+                    if SENSITIVE_PATTERNS[pattern_name].search(text):
+                        return Violation(
+                            rule="deny_fields",
+                            severity="critical",
+                            message=f"Sensitive pattern '{pattern_name}' found in payload text",
+                            evidence={"pattern": pattern_name},
+                            source_agent=payload.source,
+                            target_agent=payload.target,
+                        )
         return None
 
     def _check_require_fields(
         self, rule: ContractRule, payload: HandoffPayload
     ) -> Violation | None:
         required = set(rule.config.get("fields", []))
-        actual = _flatten_keys(payload.data)
-        top_level = {k for k in actual if "." not in k}
-        missing = required - top_level
+        missing = required - _top_level_keys(payload.data)
         if missing:
             return Violation(
                 rule="require_fields",
@@ -300,9 +307,10 @@ class DeterministicValidator:
         self, data: dict[str, Any], violations: list[Violation]
     ) -> dict[str, Any]:
         """Remove fields that caused violations from the payload."""
-        sanitized = dict(data)
-        for v in violations:
-            if v.field:
-                for field_name in v.field.split(", "):
-                    sanitized.pop(field_name, None)
-        return sanitized
+        to_drop = {
+            field_name
+            for v in violations
+            if v.field
+            for field_name in v.field.split(", ")
+        }
+        return {k: v for k, v in data.items() if k not in to_drop}
@@ -3,48 +3,188 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import deque
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Any
 
+from failsafe.core.serialization import dumps
+
+
+class Event(dict):
+    """An emitted event. Caches its JSON encodings for SSE and REST readers.
+
+    ``seq`` is the event's position in the bus's history sequence (1-based),
+    or None when history is off.
+    """
+
+    __slots__ = ("_json", "_data_json", "_handoff_json", "seq")
+
+    def to_json(self) -> str:
+        try:
+            return self._json
+        except AttributeError:
+            self._json = dumps(self)
+            return self._json
+
+    def data_json(self) -> str:
+        """JSON encoding of the event's ``data`` alone."""
+        try:
+            return self._data_json
+        except AttributeError:
+            self._data_json = dumps(self["data"])
+            return self._data_json
+
+    def handoff_json(self) -> str:
+        """JSON encoding of the handoff summary served by ``/api/handoffs/recent``."""
+        try:
+            return self._handoff_json
+        except AttributeError:
+            data = self["data"]
+            self._handoff_json = dumps({
+                "source": data.get("source"),
+                "target": data.get("target"),
+                "passed": data.get("passed"),
+                "payload": data.get("payload"),
+                "payload_preview": data.get("payload_preview"),
+                "payload_keys": data.get("payload_keys"),
+                "violations": data.get("violations", []),
+                "timestamp": data.get("timestamp"),
+                "trace_id": data.get("trace_id"),
+            })
+            return self._handoff_json
+
+
+def encode_events(events: list[dict[str, Any]]) -> str:
+    """Encode events as one SSE data payload.
+
+    A single event is sent as-is; several are wrapped as ``{"events": [...]}``
+    so one frame carries the whole batch.
+    """
+    encoded = [
+        e.to_json() if isinstance(e, Event) else dumps(e)
+        for e in events
+    ]
+    if len(encoded) == 1:
+        return encoded[0]
+    return '{"events": [' + ", ".join(encoded) + "]}"
+
+
+def _trace_id(event: dict[str, Any]) -> str | None:
+    if event["type"] != "validation" or not isinstance(event["data"], dict):
+        return None
+    return event["data"].get("trace_id")
+
 
 class EventBus:
-    """Pushes events to connected SSE clients via async queues."""
+    """Pushes events to connected SSE clients via async queues.
 
-    def __init__(self) -> None:
-        self._subscribers: list[asyncio.Queue[dict[str, Any]]] = []
-        self._history: list[dict[str, Any]] = []
+    With ``keep_history=False`` events are only delivered to live
+    subscribers, and emitters can skip building them when there are none.
+    """
+
+    def __init__(self, keep_history: bool = True) -> None:
+        self.keep_history = keep_history
+        self._subscribers: set[asyncio.Queue[dict[str, Any]]] = set()
         self._max_history = 5000
+        self._history: deque[dict[str, Any]] = deque(maxlen=self._max_history)
+        # Total events ever appended to _history, so readers can pick up
+        # only what is new since their last look.
+        self._appended = 0
+        # Validation events per trace_id still in _history, oldest first.
+        self._by_trace: dict[str, list[dict[str, Any]]] = {}
+        # history snapshot and the _appended count it was taken at
+        self._snapshot: tuple[Event, ...] = ()
+        self._snapshot_at = 0
 
     def subscribe(self) -> asyncio.Queue[dict[str, Any]]:
         """Create a new subscriber queue and return it."""
         queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=256)
-        self._subscribers.append(queue)
+        self._subscribers.add(queue)
         return queue
 
     def unsubscribe(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
         """Remove a subscriber queue."""
-        if queue in self._subscribers:
-            self._subscribers.remove(queue)
+        self._subscribers.discard(queue)
+
+    @property
+    def history(self) -> tuple[Event, ...]:
+        """Return recent event history (the newest 200 events).
+
+        The snapshot is reused until another event is appended.
+        """
+        if self._snapshot_at != self._appended:
+            self._snapshot = tuple(self.recent_events())
+            self._snapshot_at = self._appended
+        return self._snapshot
 
     @property
-    def history(self) -> list[dict[str, Any]]:
-        """Return recent event history."""
-        return self._history[-200:]
-
-    async def emit(self, event_type: str, data: Any) -> None:
-        """Broadcast an event to all SSE subscribers."""
-        message = {
-            "type": event_type,
-            "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-        self._history.append(message)
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history:]
+    def max_history(self) -> int:
+        """How many events history keeps before dropping the oldest."""
+        return self._history.maxlen
+
+    @property
+    def seq(self) -> int:
+        """``seq`` of the newest event appended to history (0 before any)."""
+        return self._appended
+
+    def recent_events(self, limit: int = 200, since: int = 0) -> list[Event]:
+        """Return up to ``limit`` of the newest history events with ``seq > since``.
+
+        A ``since`` past the current sequence (e.g. a client that outlived a
+        restart) is treated as 0.
+        """
+        newer = self._appended - since if since <= self._appended else self._appended
+        recent = list(islice(reversed(self._history), max(0, min(limit, newer))))
+        recent.reverse()
+        return recent
+
+    def has_listeners(self) -> bool:
+        """Whether an emitted event would be kept or delivered anywhere."""
+        return self.keep_history or bool(self._subscribers)
+
+    def get_by_trace(self, trace_id: str) -> dict[str, Any] | None:
+        """Return the most recent validation event for a trace, if still in history."""
+        events = self._by_trace.get(trace_id)
+        return events[-1] if events else None
+
+    def events_for_trace(self, trace_id: str) -> list[dict[str, Any]]:
+        """Return a trace's validation events still in history, oldest first."""
+        return list(self._by_trace.get(trace_id, ()))
+
+    async def emit(
+        self, event_type: str, data: Any, timestamp: str | None = None
+    ) -> None:
+        """Broadcast an event to all SSE subscribers.
+
+        ``timestamp`` is an ISO-8601 string; defaults to now (UTC).
+        """
+        message = Event(
+            type=event_type,
+            data=data,
+            timestamp=timestamp or datetime.now(timezone.utc).isoformat(),
+        )
+        message.seq = None
+        if self.keep_history:
+            if len(self._history) == self._history.maxlen:
+                evicted = self._history[0]
+                tid = _trace_id(evicted)
+                if tid is not None:
+                    # The evicted event is the oldest, so first in its list.
+                    events = self._by_trace[tid]
+                    del events[0]
+                    if not events:
+                        del self._by_trace[tid]
+            self._history.append(message)
+            self._appended += 1
+            message.seq = self._appended
+            tid = _trace_id(message)
+            if tid is not None:
+                self._by_trace.setdefault(tid, []).append(message)
 
+        # Iterate a snapshot: the dashboard thread may subscribe concurrently.
         dead: list[asyncio.Queue] = []
-        for queue in self._subscribers:
+        for queue in tuple(self._subscribers):
             try:
                 queue.put_nowait(message)
             except asyncio.QueueFull:
@@ -2,7 +2,8 @@ import { useEffect, useRef, useState, useCallback } from 'react';
 
 /**
  * Hook that connects to the FailSafe SSE endpoint and streams events.
- * Reconnects automatically on disconnect with exponential backoff.
+ * Reconnects automatically on disconnect with exponential backoff, resuming
+ * after the last event id seen so history is not replayed twice.
  */
 export default function useEventStream(url) {
   const [events, setEvents] = useState([]);
@@ -10,12 +11,16 @@ export default function useEventStream(url) {
   const sourceRef = useRef(null);
   const reconnectTimer = useRef(null);
   const backoff = useRef(1000);
+  const lastEventId = useRef('');
 
   const connect = useCallback(() => {
     if (sourceRef.current) return;
 
     try {
-      const es = new EventSource(url);
+      const resumeUrl = lastEventId.current
+        ? `${url}${url.includes('?') ? '&' : '?'}since=${lastEventId.current}`
+        : url;
+      const es = new EventSource(resumeUrl);
       sourceRef.current = es;
 
       es.onopen = () => {
@@ -24,10 +29,13 @@ export default function useEventStream(url) {
       };
 
       es.onmessage = (evt) => {
+        if (evt.lastEventId) lastEventId.current = evt.lastEventId;
         try {
           const msg = JSON.parse(evt.data);
+          // The server batches events into {events: [...]} when several are queued
+          const batch = Array.isArray(msg.events) ? msg.events : [msg];
           setEvents((prev) => {
-            const next = [...prev, msg];
+            const next = [...prev, ...batch];
             return next.length > 500 ? next.slice(-500) : next;
           });
         } catch {
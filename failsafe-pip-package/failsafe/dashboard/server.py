@@ -3,20 +3,30 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, Header
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from sse_starlette.sse import EventSourceResponse
 
+from failsafe.core.serialization import dumps
+from failsafe.dashboard.events import encode_events
+
 if TYPE_CHECKING:
     from failsafe.core.engine import FailSafe
 
 FRONTEND_DIST_DIR = Path(__file__).parent / "frontend" / "dist"
 
+# Most events packed into one SSE frame.
+SSE_MAX_BATCH = 64
+
+
+def _json_response(body: str) -> Response:
+    """Send already-encoded JSON, bypassing FastAPI's jsonable_encoder."""
+    return Response(body, media_type="application/json")
+
 
 def create_app(fs: "FailSafe") -> FastAPI:
     app = FastAPI(title="FailSafe Dashboard")
@@ -24,25 +34,54 @@ def create_app(fs: "FailSafe") -> FastAPI:
     # --- SSE Stream ---
 
     @app.get("/api/stream")
-    async def sse_stream(request: Request):
+    async def sse_stream(
+        since: int = 0,
+        last_event_id: str | None = Header(None),
+    ):
+        """Stream events. Frames carry the last event's ``seq`` as their SSE id.
+
+        A reconnecting client passes that id back (``?since=`` or the
+        ``Last-Event-ID`` header) and is only replayed what it missed.
+        """
+        if last_event_id and last_event_id.isdigit():
+            since = max(since, int(last_event_id))
+        if since > fs.event_bus.seq:
+            # An id from before a server restart: the sequence began again,
+            # so everything the bus holds is new to this client.
+            since = 0
         queue = fs.event_bus.subscribe()
 
         async def event_generator():
-            # Send recent history first
-            for event in fs.event_bus.history:
-                yield {"data": json.dumps(event)}
-
-            # Then stream live events
+            # Send recent history first, as a single frame
+            last_seq = since
+            history = fs.event_bus.recent_events(since=since)
+            if history:
+                last_seq = history[-1].seq
+                yield {"data": encode_events(history), "id": str(last_seq)}
+
+            # Then stream live events, coalescing whatever has queued up
+            # since the last frame. EventSourceResponse cancels this
+            # generator when the client disconnects.
             try:
                 while True:
-                    if await request.is_disconnected():
-                        break
                     try:
                         event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                        yield {"data": json.dumps(event)}
                     except asyncio.TimeoutError:
                         # Send keepalive comment
                         yield {"comment": "keepalive"}
+                        continue
+                    batch = [event]
+                    while len(batch) < SSE_MAX_BATCH and not queue.empty():
+                        batch.append(queue.get_nowait())
+                    # Drop events already sent with the history frame
+                    batch = [e for e in batch if e.seq is None or e.seq > last_seq]
+                    if not batch:
+                        continue
+                    frame = {"data": encode_events(batch)}
+                    if batch[-1].seq is not None:
+                        last_seq = batch[-1].seq
+                        frame["id"] = str(last_seq)
+                    yield frame
             finally:
                 fs.event_bus.unsubscribe(queue)
 
@@ -52,17 +91,15 @@ def create_app(fs: "FailSafe") -> FastAPI:
 
     @app.get("/api/agents")
     async def get_agents():
-        agents = fs.registry.list_all()
-        return [a.model_dump() for a in agents]
+        return _json_response(dumps(fs.registry.list_all_dumped()))
 
     @app.get("/api/contracts")
     async def get_contracts():
-        contracts = fs.contracts.list_all()
-        return [c.model_dump() for c in contracts]
+        return _json_response(dumps(fs.contracts.list_all_dumped()))
 
     @app.get("/api/coverage")
     async def get_coverage():
-        return fs.contracts.coverage_matrix()
+        return _json_response(dumps(fs.contracts.coverage_matrix()))
 
     @app.get("/api/validations")
     async def get_validations(
@@ -73,7 +110,7 @@ def create_app(fs: "FailSafe") -> FastAPI:
         limit: int = 100,
         offset: int = 0,
     ):
-        return await fs.audit_log.query(
+        rows = await fs.audit_log.query(
             source=source,
             target=target,
             passed=passed,
@@ -81,57 +118,45 @@ def create_app(fs: "FailSafe") -> FastAPI:
             limit=limit,
             offset=offset,
         )
+        return _json_response(dumps(rows))
 
     @app.get("/api/violations/{validation_id}")
     async def get_violations(validation_id: int):
-        return await fs.audit_log.get_violations(validation_id)
+        return _json_response(dumps(await fs.audit_log.get_violations(validation_id)))
 
     @app.get("/api/handoffs/recent")
     async def get_recent_handoffs(limit: int = 50):
         """Get recent handoffs with payload data from event bus history."""
         events = fs.event_bus.history[-limit:]
-        return [
-            {
-                "source": e["data"].get("source"),
-                "target": e["data"].get("target"),
-                "passed": e["data"].get("passed"),
-                "payload": e["data"].get("payload"),
-                "payload_preview": e["data"].get("payload_preview"),
-                "payload_keys": e["data"].get("payload_keys"),
-                "violations": e["data"].get("violations", []),
-                "timestamp": e["data"].get("timestamp"),
-                "trace_id": e["data"].get("trace_id"),
-            }
-            for e in events
-            if e.get("type") == "validation"
-        ]
+        return _json_response("[" + ", ".join(
+            e.handoff_json() for e in events if e.get("type") == "validation"
+        ) + "]")
 
     @app.get("/api/handoffs/{trace_id}")
     async def get_handoff_detail(trace_id: str):
         """Get full handoff details for a specific trace ID."""
-        for e in reversed(fs.event_bus._history):
-            if e.get("type") == "validation" and e["data"].get("trace_id") == trace_id:
-                return e["data"]
-        return {"error": "Not found"}
+        event = fs.event_bus.get_by_trace(trace_id)
+        if event is None:
+            return {"error": "Not found"}
+        return _json_response(event.data_json())
 
     @app.get("/api/graph")
     async def get_graph():
-        agents = fs.registry.list_all()
-        contracts = fs.contracts.list_all()
         nodes = [
-            {"id": a.name, "label": a.name, "data": a.model_dump()} for a in agents
+            {"id": a["name"], "label": a["name"], "data": a}
+            for a in fs.registry.list_all_dumped()
         ]
         edges = [
             {
-                "id": c.name,
-                "source": c.source,
-                "target": c.target,
-                "label": c.name,
-                "data": c.model_dump(),
+                "id": c["name"],
+                "source": c["source"],
+                "target": c["target"],
+                "label": c["name"],
+                "data": c,
             }
-            for c in contracts
+            for c in fs.contracts.list_all_dumped()
         ]
-        return {"nodes": nodes, "edges": edges}
+        return _json_response(dumps({"nodes": nodes, "edges": edges}))
 
     # --- Static files (React frontend) ---
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import time
+from collections import deque
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
-from uuid import uuid4
+from typing import TYPE_CHECKING, Any, Iterator
 
+from failsafe.core.ids import new_trace_id
 from failsafe.core.models import Violation
 
 if TYPE_CHECKING:
@@ -18,6 +20,14 @@ except ImportError:
     class AsyncCallbackHandler:  # type: ignore[no-redef]
         pass
 
+# Events carry raw epoch nanoseconds; ISO strings are only built for output.
+_now = time.time_ns
+
+
+def _fmt_ts(ns: int) -> str:
+    """Format epoch nanoseconds as an ISO 8601 UTC timestamp."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
 
 class FailSafeCallbackHandler(AsyncCallbackHandler):
     """Drop-in callback handler for LangChain.
@@ -29,18 +39,36 @@ class FailSafeCallbackHandler(AsyncCallbackHandler):
     Usage:
         handler = FailSafeCallbackHandler(failsafe=fs, mode="warn")
         result = await agent.invoke(input, config={"callbacks": [handler]})
+
+    Events in ``audit_log`` are stamped with ``ts_ns`` (epoch nanoseconds);
+    ``summary()`` adds formatted ``timestamp`` strings to its handoffs.
+
+    Pass ``max_audit_events`` to keep only the most recent events in
+    ``audit_log``, and the most recent handoffs in ``summary()``, for
+    long-running chains. Both are unbounded by default.
     """
 
     name = "failsafe"
 
-    def __init__(self, failsafe: "FailSafe", mode: str = "warn"):
+    def __init__(
+        self,
+        failsafe: "FailSafe",
+        mode: str = "warn",
+        max_audit_events: int | None = None,
+    ):
         self.fs = failsafe
         self.mode = mode
         self.violations: list[Violation] = []
-        self.audit_log: list[dict[str, Any]] = []
+        self.audit_log: deque[dict[str, Any]] = deque(maxlen=max_audit_events)
         self._chain_stack: list[str] = []
+        # Top of _chain_stack, or "unknown" when it is empty
+        self._current_chain = "unknown"
         self._chain_inputs: dict[str, dict] = {}
-        self._trace_id = str(uuid4())
+        self._trace_id = new_trace_id()
+        # Aggregates for summary(), maintained as events are recorded
+        self._chains_seen: dict[str, None] = {}
+        self._tools_called: dict[str, None] = {}
+        self._handoffs: deque[dict[str, Any]] = deque(maxlen=max_audit_events)
 
     async def on_chain_start(
         self,
@@ -50,14 +78,16 @@ class FailSafeCallbackHandler(AsyncCallbackHandler):
     ) -> None:
         chain_name = serialized.get("name", serialized.get("id", ["unknown"])[-1])
         self._chain_stack.append(chain_name)
+        self._current_chain = chain_name
+        self._chains_seen[chain_name] = None
         if isinstance(inputs, dict):
             self._chain_inputs[chain_name] = inputs
         self.audit_log.append(
             {
                 "event": "chain_start",
                 "chain": chain_name,
-                "inputs_keys": list(inputs.keys()) if isinstance(inputs, dict) else [],
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "inputs_keys": list(inputs) if isinstance(inputs, dict) else [],
+                "ts_ns": _now(),
                 "trace_id": self._trace_id,
             }
         )
@@ -68,11 +98,20 @@ class FailSafeCallbackHandler(AsyncCallbackHandler):
         **kwargs: Any,
     ) -> None:
         chain_name = self._chain_stack.pop() if self._chain_stack else "unknown"
+        self._current_chain = self._chain_stack[-1] if self._chain_stack else "unknown"
+        self._chains_seen[chain_name] = None
 
-        # If there's a previous chain in the stack, validate the handoff
-        if self._chain_stack:
-            source = self._chain_stack[-1]
-            target = chain_name
+        # If there's a previous chain in the stack, validate the handoff.
+        # A chain handing back to itself carries no data between agents,
+        # and an empty output has nothing to check unless the edge has a
+        # contract (e.g. require_fields) or policies are loaded.
+        source = self._current_chain
+        target = chain_name
+        if self._chain_stack and source != target and (
+            outputs
+            or self.fs.contracts.get(source, target) is not None
+            or self.fs.policy_engine.has_policies()
+        ):
             payload = outputs if isinstance(outputs, dict) else {"output": str(outputs)}
 
             result = await self.fs.handoff(
@@ -83,23 +122,25 @@ class FailSafeCallbackHandler(AsyncCallbackHandler):
             )
             self.violations.extend(result.violations)
 
-            self.audit_log.append({
+            handoff = {
                 "event": "handoff",
                 "source": source,
                 "target": target,
                 "passed": result.passed,
                 "violation_count": len(result.violations),
-                "payload_keys": list(payload.keys()),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "payload_keys": list(payload),
+                "ts_ns": _now(),
                 "trace_id": self._trace_id,
-            })
+            }
+            self.audit_log.append(handoff)
+            self._handoffs.append(handoff)
 
         self.audit_log.append(
             {
                 "event": "chain_end",
                 "chain": chain_name,
-                "output_keys": list(outputs.keys()) if isinstance(outputs, dict) else [],
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "output_keys": list(outputs) if isinstance(outputs, dict) else [],
+                "ts_ns": _now(),
                 "trace_id": self._trace_id,
             }
         )
@@ -114,14 +155,15 @@ class FailSafeCallbackHandler(AsyncCallbackHandler):
         **kwargs: Any,
     ) -> None:
         tool_name = serialized.get("name", "unknown_tool")
-        agent_name = self._chain_stack[-1] if self._chain_stack else "unknown"
+        agent_name = self._current_chain
+        self._tools_called[tool_name] = None
 
         self.audit_log.append(
             {
                 "event": "tool_start",
                 "tool": tool_name,
                 "agent": agent_name,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "ts_ns": _now(),
                 "trace_id": self._trace_id,
             }
         )
@@ -142,7 +184,7 @@ class FailSafeCallbackHandler(AsyncCallbackHandler):
         self.audit_log.append(
             {
                 "event": "tool_end",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "ts_ns": _now(),
                 "trace_id": self._trace_id,
             }
         )
@@ -153,7 +195,7 @@ class FailSafeCallbackHandler(AsyncCallbackHandler):
         prompts: list[str],
         **kwargs: Any,
     ) -> None:
-        agent_name = self._chain_stack[-1] if self._chain_stack else "unknown"
+        agent_name = self._current_chain
         model = serialized.get("kwargs", {}).get(
             "model_name", serialized.get("id", ["unknown"])[-1]
         )
@@ -163,13 +205,13 @@ class FailSafeCallbackHandler(AsyncCallbackHandler):
                 "agent": agent_name,
                 "model": model,
                 "prompt_count": len(prompts) if isinstance(prompts, list) else 1,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "ts_ns": _now(),
                 "trace_id": self._trace_id,
             }
         )
 
     async def on_llm_end(self, response: Any, **kwargs: Any) -> None:
-        agent_name = self._chain_stack[-1] if self._chain_stack else "unknown"
+        agent_name = self._current_chain
         token_usage = {}
         if hasattr(response, "llm_output") and response.llm_output:
             token_usage = response.llm_output.get("token_usage", {})
@@ -178,13 +220,13 @@ class FailSafeCallbackHandler(AsyncCallbackHandler):
                 "event": "llm_end",
                 "agent": agent_name,
                 "token_usage": token_usage,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "ts_ns": _now(),
                 "trace_id": self._trace_id,
             }
         )
 
     async def on_agent_action(self, action: Any, **kwargs: Any) -> None:
-        agent_name = self._chain_stack[-1] if self._chain_stack else "unknown"
+        agent_name = self._current_chain
         tool = getattr(action, "tool", "unknown")
 
         self.audit_log.append(
@@ -192,24 +234,24 @@ class FailSafeCallbackHandler(AsyncCallbackHandler):
                 "event": "agent_action",
                 "agent": agent_name,
                 "tool": tool,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "ts_ns": _now(),
                 "trace_id": self._trace_id,
             }
         )
 
+    def iter_events(self) -> Iterator[dict[str, Any]]:
+        """Iterate over recorded audit events, oldest first."""
+        return iter(self.audit_log)
+
     def summary(self) -> dict:
         """Return a summary of what was observed."""
         return {
             "trace_id": self._trace_id,
             "total_events": len(self.audit_log),
-            "chains_seen": list(set(
-                e["chain"] for e in self.audit_log if "chain" in e
-            )),
-            "tools_called": list(set(
-                e["tool"] for e in self.audit_log if e.get("event") == "tool_start"
-            )),
+            "chains_seen": list(self._chains_seen),
+            "tools_called": list(self._tools_called),
             "handoffs": [
-                e for e in self.audit_log if e.get("event") == "handoff"
+                {**h, "timestamp": _fmt_ts(h["ts_ns"])} for h in self._handoffs
             ],
             "violations": [
                 {"rule": v.rule, "severity": v.severity, "message": v.message}
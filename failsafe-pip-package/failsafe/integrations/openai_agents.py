@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -29,10 +30,14 @@ class FailSafeTraceProcessor:
                 if hasattr(span, "data"):
                     source = getattr(span, "agent_name", "unknown")
                     target = getattr(span, "target_agent", "unknown")
-                    payload = (
-                        span.data
-                        if isinstance(span.data, dict)
-                        else {"data": str(span.data)}
-                    )
+                    data = span.data
+                    if isinstance(data, dict):
+                        payload = data
+                    elif isinstance(data, Mapping):
+                        # Keep fields visible to contracts instead of
+                        # flattening the whole mapping into one string.
+                        payload = dict(data)
+                    else:
+                        payload = {"data": str(data)}
                     result = self.fs.trace(source, target, payload)
                     self.violations.extend(result.violations)
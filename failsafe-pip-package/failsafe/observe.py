@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import sys
-from functools import wraps
+from collections import deque
+from functools import cache, wraps
+from importlib.util import find_spec
 from typing import Any
-from uuid import uuid4
 
 from failsafe.core.engine import FailSafe
+from failsafe.core.ids import new_trace_id
 from failsafe.core.models import ValidationResult
 
 
@@ -17,9 +19,12 @@ class FailSafeObserver:
 
     def __init__(self, fs: FailSafe):
         self.fs = fs
-        self._trace_id = str(uuid4())
+        self._trace_id = new_trace_id()
         self._last_agent: str | None = None
         self._last_output: dict[str, Any] | None = None
+        # Capped like the event history it is collected from
+        self._violations: deque = deque(maxlen=fs.event_bus.max_history)
+        self._scanned = 0
 
     def trace(self, source: str, target: str, payload: dict) -> ValidationResult:
         """Log a data handoff between two agents. Synchronous."""
@@ -81,53 +86,54 @@ class FailSafeObserver:
 
     @property
     def violations(self) -> list:
-        """Return all violations seen so far across all traces."""
-        violations = []
-        for event in self.fs.event_bus._history:
+        """Return all violations seen so far across all traces.
+
+        Only events emitted since the last access are scanned, and only the
+        newest ``event_bus.max_history`` violations are kept.
+        """
+        bus = self.fs.event_bus
+        for event in bus.recent_events(limit=bus.max_history, since=self._scanned):
             data = event.get("data", {})
-            for v in data.get("violations", []):
-                violations.append(v)
-        return violations
+            self._violations.extend(data.get("violations", []))
+        self._scanned = bus.seq
+        return list(self._violations)
 
     @property
-    def audit_log(self) -> list:
+    def audit_log(self) -> tuple:
         """Return the event bus history."""
         return self.fs.event_bus.history
 
 
-def _detect_framework() -> str | None:
-    """Detect which agent framework is installed, return its name or None."""
-    # Check in priority order (most specific first)
-    try:
-        import langgraph  # noqa: F401
-        return "langgraph"
-    except ImportError:
-        pass
+# Checked in priority order (most specific first).
+_FRAMEWORK_PACKAGES = (
+    ("langgraph", "langgraph"),
+    ("langchain_core", "langchain"),
+    ("crewai", "crewai"),
+    ("autogen_agentchat", "autogen"),
+    ("agents", "openai_agents"),
+)
 
-    try:
-        import langchain_core  # noqa: F401
-        return "langchain"
-    except ImportError:
-        pass
 
+def _is_installed(package: str) -> bool:
+    """True if *package* is importable, without running its import."""
+    if package in sys.modules:
+        return True
     try:
-        import crewai  # noqa: F401
-        return "crewai"
-    except ImportError:
-        pass
+        return find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
 
-    try:
-        import autogen_agentchat  # noqa: F401
-        return "autogen"
-    except ImportError:
-        pass
 
-    try:
-        import agents  # noqa: F401
-        return "openai_agents"
-    except ImportError:
-        pass
+@cache
+def _detect_framework() -> str | None:
+    """Detect which agent framework is installed, return its name or None.
 
+    Uses find_spec() so detection does not execute the frameworks' (heavy)
+    package initialisation. Cached: each probe walks sys.path.
+    """
+    for package, framework in _FRAMEWORK_PACKAGES:
+        if _is_installed(package):
+            return framework
     return None
 
 
@@ -10,38 +10,67 @@ from failsafe.core.policy import Policy, PolicyPack
 SSN_PATTERN = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
 ACCOUNT_PATTERN = re.compile(r"\b\d{8,17}\b")
 
-EU_COUNTRIES = {
+# Both patterns in one pass; group names map to the names reported.
+PII_PATTERN = re.compile(
+    rf"(?P<ssn>{SSN_PATTERN.pattern})|(?P<account>{ACCOUNT_PATTERN.pattern})"
+)
+_PII_GROUP_NAMES = {"ssn": "ssn", "account": "account_number"}
+
+PII_FIELDS = frozenset({
+    "ssn", "social_security", "tax_id", "bank_account", "account_number",
+})
+
+EU_COUNTRIES = frozenset({
     "AT", "BE", "BG", "HR", "CY", "CZ", "DK", "EE", "FI", "FR",
     "DE", "GR", "HU", "IE", "IT", "LV", "LT", "LU", "MT", "NL",
     "PL", "PT", "RO", "SK", "SI", "ES", "SE",
-}
+})
 
 
 def _is_eu_data(payload: HandoffPayload) -> bool:
-    country = payload.data.get("country", "").upper()
-    region = payload.data.get("region", "").upper()
-    return country in EU_COUNTRIES or region == "EU"
+    # Codes are usually sent upper-case already; only fold when they aren't.
+    country = payload.data.get("country", "")
+    if not country.isupper():
+        country = country.upper()
+    if country in EU_COUNTRIES:
+        return True
+    region = payload.data.get("region", "")
+    if not region.isupper():
+        region = region.upper()
+    return region == "EU"
 
 
 def _scan_text_for_patterns(data: dict) -> list[str]:
-    """Recursively scan all string values for sensitive patterns."""
-    found: list[str] = []
-    for value in data.values():
-        if isinstance(value, str):
-            if SSN_PATTERN.search(value):
-                found.append("ssn")
-            if ACCOUNT_PATTERN.search(value):
-                found.append("account_number")
-        elif isinstance(value, dict):
-            found.extend(_scan_text_for_patterns(value))
-    return found
+    """Scan all nested string values for sensitive patterns.
+
+    String leaves are joined with NUL, which is neither a digit nor a word
+    character, so one regex pass sees each value exactly as it would alone.
+    Returns the sorted pattern names found.
+    """
+    parts: list[str] = []
+    stack: list = [data]
+    while stack:
+        node = stack.pop()
+        values = node.values() if isinstance(node, dict) else node
+        for value in values:
+            if isinstance(value, str):
+                parts.append(value)
+            elif isinstance(value, (dict, list, tuple)):
+                stack.append(value)
+
+    found: set[str] = set()
+    for m in PII_PATTERN.finditer("\x00".join(parts)):
+        found.add(m.lastgroup)
+        if len(found) == len(_PII_GROUP_NAMES):
+            break
+    return sorted(_PII_GROUP_NAMES[g] for g in found)
 
 
 def _check_pii_leakage(payload: HandoffPayload) -> Violation | None:
-    pii_fields = {"ssn", "social_security", "tax_id", "bank_account", "account_number"}
-    found = pii_fields & set(payload.data.keys())
+    found = PII_FIELDS & payload.data.keys()
 
-    patterns_found = _scan_text_for_patterns(payload.data)
+    # A PII key already decides the violation; only scan values otherwise.
+    patterns_found = [] if found else _scan_text_for_patterns(payload.data)
 
     if found or patterns_found:
         return Violation(
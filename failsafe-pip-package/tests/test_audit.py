@@ -0,0 +1,184 @@
+"""Tests for the SQLite-backed audit log."""
+
+import pytest
+
+from failsafe.core.audit import AuditLog
+from failsafe.core.models import HandoffPayload, ValidationResult, Violation
+
+
+def make_record(source="a", target="b", passed=True, trace_id="trace-1"):
+    handoff = HandoffPayload(
+        source=source, target=target, data={"x": 1}, trace_id=trace_id
+    )
+    violations = [] if passed else [
+        Violation(rule="deny_fields", severity="critical", message="bad", field="x")
+    ]
+    result = ValidationResult(
+        passed=passed, violations=violations, contract_name="c1"
+    )
+    return handoff, result
+
+
+class TestMemoryDatabase:
+    def test_memory_db_not_allocated_on_construction(self):
+        log = AuditLog(db_path=":memory:")
+        assert log._tmp is None
+        assert log.db_path == ":memory:"
+
+    @pytest.mark.asyncio
+    async def test_memory_db_allocated_on_first_record(self):
+        log = AuditLog(db_path=":memory:")
+        await log.record(*make_record())
+        assert log._tmp is not None
+        assert log.db_path != ":memory:"
+
+
+class TestRecordAndQuery:
+    @pytest.mark.asyncio
+    async def test_record_roundtrip(self):
+        log = AuditLog(db_path=":memory:")
+        await log.record(*make_record(trace_id="t-1"))
+        await log.record(*make_record(passed=False, trace_id="t-2"))
+
+        rows = await log.query()
+        assert len(rows) == 2
+
+        failed = await log.query(passed=False)
+        assert len(failed) == 1
+        assert failed[0]["trace_id"] == "t-2"
+
+    @pytest.mark.asyncio
+    async def test_violations_recorded(self):
+        log = AuditLog(db_path=":memory:")
+        await log.record(*make_record(passed=False))
+        violations = await log.get_violations(1)
+        assert len(violations) == 1
+        assert violations[0]["rule"] == "deny_fields"
+
+
+class TestConnectionReuse:
+    @pytest.mark.asyncio
+    async def test_connection_shared_across_calls(self):
+        log = AuditLog(db_path=":memory:")
+        await log.record(*make_record())
+        conn = log._loop_connection()
+        db = conn.db
+        await log.query()
+        await log.record(*make_record(trace_id="t-2"))
+        assert conn.db is db
+        await log.close()
+        assert conn.db is None
+
+    def test_connection_closed_when_loop_shuts_down(self):
+        import asyncio
+
+        log = AuditLog(db_path=":memory:")
+
+        async def run():
+            await log.record(*make_record())
+            return log._loop_connection()
+
+        conn = asyncio.run(run())
+        assert conn.db is None
+        assert asyncio.run(log.query())
+
+
+class TestBufferedWrites:
+    @pytest.mark.asyncio
+    async def test_enqueue_visible_to_reads(self):
+        log = AuditLog(db_path=":memory:", flush_interval=60)
+        log.enqueue(*make_record(trace_id="t-1"))
+        log.enqueue(*make_record(passed=False, trace_id="t-2"))
+        assert len(log._pending) == 2
+
+        rows = await log.query()
+        assert {r["trace_id"] for r in rows} == {"t-1", "t-2"}
+        assert len(await log.get_violations(2)) == 1
+
+    @pytest.mark.asyncio
+    async def test_background_flush(self):
+        import asyncio
+
+        log = AuditLog(db_path=":memory:", flush_interval=0.01)
+        log.enqueue(*make_record())
+        await asyncio.sleep(0.2)
+        assert log._pending == []
+
+    def test_buffer_written_when_loop_shuts_down(self):
+        import asyncio
+
+        log = AuditLog(db_path=":memory:", flush_interval=60)
+
+        async def run():
+            log.enqueue(*make_record(trace_id="t-1"))
+
+        asyncio.run(run())
+        rows = asyncio.run(log.query())
+        assert [r["trace_id"] for r in rows] == ["t-1"]
+
+    def test_buffer_from_closed_loop_written_by_next_read(self):
+        import asyncio
+
+        log = AuditLog(db_path=":memory:", flush_interval=60)
+        loop = asyncio.new_event_loop()
+
+        async def run():
+            log.enqueue(*make_record(trace_id="t-1"))
+
+        # Unlike asyncio.run(), this never cancels the loop's tasks
+        loop.run_until_complete(run())
+        loop.close()
+
+        rows = asyncio.run(log.query())
+        assert [r["trace_id"] for r in rows] == ["t-1"]
+
+    @pytest.mark.asyncio
+    async def test_hash_taken_at_enqueue(self):
+        log = AuditLog(db_path=":memory:", flush_interval=60)
+        before = AuditLog(db_path=":memory:")
+        handoff, result = make_record()
+        log.enqueue(handoff, result)
+        before.enqueue(handoff.model_copy(deep=True), result)
+        handoff.data["x"] = 2
+
+        hashes = [audit._pending[0][0][2] for audit in (log, before)]
+        assert hashes[0] == hashes[1]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_kept_and_logged(self, monkeypatch, caplog):
+        import asyncio
+        import sqlite3
+
+        log = AuditLog(db_path=":memory:", flush_interval=0.01)
+
+        async def broken(conn):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(log, "_ensure_tables", broken)
+        log.enqueue(*make_record(trace_id="t-1"))
+        await asyncio.sleep(0.1)
+        assert len(log._pending) == 1
+        assert "disk I/O error" in caplog.text
+
+        monkeypatch.undo()
+        rows = await log.query()
+        assert [r["trace_id"] for r in rows] == ["t-1"]
+
+
+    @pytest.mark.asyncio
+    async def test_retry_buffer_capped(self, monkeypatch, caplog):
+        import sqlite3
+
+        log = AuditLog(db_path=":memory:", flush_interval=60, max_pending=3)
+
+        async def broken(conn):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(log, "_ensure_tables", broken)
+        for i in range(5):
+            log.enqueue(*make_record(trace_id=f"t-{i}"))
+        with pytest.raises(sqlite3.OperationalError):
+            await log.flush()
+
+        assert [rows[0][3] for rows in log._pending] == ["t-2", "t-3", "t-4"]
+        assert "dropped the 2 oldest" in caplog.text
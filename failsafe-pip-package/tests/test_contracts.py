@@ -3,7 +3,8 @@
 import pytest
 
 from failsafe.core.contracts import ContractRegistry
-from failsafe.core.models import Contract, ContractRule
+from failsafe.core.models import AgentCard, Contract, ContractRule
+from failsafe.core.registry import AgentRegistry
 
 
 def make_contract(name: str, source: str, target: str, **kwargs) -> Contract:
@@ -51,6 +52,88 @@ class TestContractRegistry:
         self.registry.register(c2)
         assert self.registry.get("a", "b").mode == "block"
 
+    def test_reregister_name_on_new_pair(self):
+        self.registry.register(make_contract("c1", "a", "b"))
+        self.registry.register(make_contract("c1", "a", "c"))
+        assert self.registry.get("a", "b") is None
+        assert self.registry.get("a", "c").name == "c1"
+        assert "b" not in self.registry.coverage_matrix()["a"]
+
+    def test_list_all_dumped_cached_until_register(self):
+        self.registry.register(make_contract("c1", "a", "b"))
+        first = self.registry.list_all_dumped()
+        assert first == [self.registry.get("a", "b").model_dump()]
+        assert self.registry.list_all_dumped() is first
+        self.registry.register(make_contract("c2", "b", "c"))
+        assert [c["name"] for c in self.registry.list_all_dumped()] == ["c1", "c2"]
+
+    def test_list_all_dumped_reflects_contract_changes(self):
+        contract = make_contract("c1", "a", "b")
+        self.registry.register(contract)
+        assert self.registry.list_all_dumped()[0]["mode"] == "warn"
+        contract.mode = "block"
+        assert self.registry.list_all_dumped()[0]["mode"] == "block"
+
+
+class TestAgentAuthority:
+    def setup_method(self):
+        self.registry = AgentRegistry()
+
+    def test_authority_rules(self):
+        self.registry.register(AgentCard(
+            name="a", authority=["tool:search"], deny_authority=["tool:pay"]
+        ))
+        self.registry.register(AgentCard(name="open", deny_authority=["tool:pay"]))
+        assert self.registry.has_authority("a", "tool:search")
+        assert not self.registry.has_authority("a", "tool:other")
+        assert not self.registry.has_authority("a", "tool:pay")
+        assert self.registry.has_authority("open", "tool:other")
+        assert not self.registry.has_authority("open", "tool:pay")
+        assert not self.registry.has_authority("missing", "tool:search")
+
+    def test_cached_answer_invalidated_by_register(self):
+        assert not self.registry.has_authority("a", "tool:search")
+        self.registry.register(AgentCard(name="a"))
+        assert self.registry.has_authority("a", "tool:search")
+        self.registry.register(AgentCard(name="a", deny_authority=["tool:search"]))
+        assert not self.registry.has_authority("a", "tool:search")
+
+    def test_cached_views_follow_agent_changes(self):
+        agent = AgentCard(name="a", authority=["tool:search"])
+        self.registry.register(agent)
+        assert self.registry.has_authority("a", "tool:search")
+        assert self.registry.list_all_dumped()[0]["description"] == ""
+
+        agent.deny_authority = ["tool:search"]
+        agent.description = "changed"
+        assert not self.registry.has_authority("a", "tool:search")
+        assert self.registry.list_all_dumped()[0]["description"] == "changed"
+
+
+class TestContractShorthand:
+    def test_shorthand_builds_rules_in_order(self):
+        from failsafe.core.engine import FailSafe
+
+        fs = FailSafe(audit_db=":memory:")
+        c = fs.contract(
+            name="c", source="a", target="b",
+            require=["id"], deny=["ssn"], allow=["id", "name"],
+            rules=[{"type": "field_value", "field": "id", "value": 1}],
+        )
+        assert [r.rule_type for r in c.rules] == [
+            "allow_fields", "deny_fields", "require_fields", "field_value",
+        ]
+        assert c.rules[1].config == {"fields": ["ssn"], "patterns": ["ssn", "credit_card"]}
+
+    def test_deny_patterns_not_shared_between_contracts(self):
+        from failsafe.core.engine import FailSafe
+
+        fs = FailSafe(audit_db=":memory:")
+        c1 = fs.contract(name="c1", source="a", target="b", deny=["x"])
+        c2 = fs.contract(name="c2", source="b", target="c", deny=["x"])
+        c1.rules[0].config["patterns"].append("extra")
+        assert c2.rules[0].config["patterns"] == ["ssn", "credit_card"]
+
 
 class TestContractModel:
     def test_default_mode(self):
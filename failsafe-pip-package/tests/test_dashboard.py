@@ -1,16 +1,18 @@
 """Tests for dashboard server and SSE stream."""
 
 import asyncio
+import json
+from collections import deque
 
 import httpx
 import pytest
 
 from failsafe.core.engine import FailSafe
+from failsafe.dashboard.events import encode_events
 from failsafe.dashboard.server import create_app
 
 
-@pytest.fixture
-def fs():
+def _make_fs() -> FailSafe:
     fs = FailSafe(mode="warn", audit_db=":memory:")
     fs.register_agent("kyc_agent", description="KYC verification")
     fs.register_agent("onboarding_agent", description="Onboarding flow")
@@ -24,65 +26,64 @@ def fs():
     return fs
 
 
+@pytest.fixture
+def fs():
+    return _make_fs()
+
+
+@pytest.fixture(scope="module")
+def rest_app():
+    """One app for the read-only REST tests; building routes is the costly part."""
+    return create_app(_make_fs())
+
+
+@pytest.fixture
+async def client(rest_app):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=rest_app), base_url="http://test"
+    ) as client:
+        yield client
+
+
 class TestRESTEndpoints:
     @pytest.mark.asyncio
-    async def test_get_agents(self, fs):
-        app = create_app(fs)
-        async with httpx.AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get("/api/agents")
-            assert response.status_code == 200
-            agents = response.json()
-            assert len(agents) == 2
-            names = {a["name"] for a in agents}
-            assert "kyc_agent" in names
-            assert "onboarding_agent" in names
+    async def test_get_agents(self, client):
+        response = await client.get("/api/agents")
+        assert response.status_code == 200
+        agents = response.json()
+        assert len(agents) == 2
+        names = {a["name"] for a in agents}
+        assert "kyc_agent" in names
+        assert "onboarding_agent" in names
 
     @pytest.mark.asyncio
-    async def test_get_contracts(self, fs):
-        app = create_app(fs)
-        async with httpx.AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get("/api/contracts")
-            assert response.status_code == 200
-            contracts = response.json()
-            assert len(contracts) == 1
-            assert contracts[0]["name"] == "kyc-to-onboarding"
+    async def test_get_contracts(self, client):
+        response = await client.get("/api/contracts")
+        assert response.status_code == 200
+        contracts = response.json()
+        assert len(contracts) == 1
+        assert contracts[0]["name"] == "kyc-to-onboarding"
 
     @pytest.mark.asyncio
-    async def test_get_coverage(self, fs):
-        app = create_app(fs)
-        async with httpx.AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get("/api/coverage")
-            assert response.status_code == 200
-            matrix = response.json()
-            assert matrix["kyc_agent"]["onboarding_agent"] == "covered"
+    async def test_get_coverage(self, client):
+        response = await client.get("/api/coverage")
+        assert response.status_code == 200
+        matrix = response.json()
+        assert matrix["kyc_agent"]["onboarding_agent"] == "covered"
 
     @pytest.mark.asyncio
-    async def test_get_graph(self, fs):
-        app = create_app(fs)
-        async with httpx.AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get("/api/graph")
-            assert response.status_code == 200
-            data = response.json()
-            assert len(data["nodes"]) == 2
-            assert len(data["edges"]) == 1
+    async def test_get_graph(self, client):
+        response = await client.get("/api/graph")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["nodes"]) == 2
+        assert len(data["edges"]) == 1
 
     @pytest.mark.asyncio
-    async def test_get_validations_empty(self, fs):
-        app = create_app(fs)
-        async with httpx.AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get("/api/validations")
-            assert response.status_code == 200
-            assert response.json() == []
+    async def test_get_validations_empty(self, client):
+        response = await client.get("/api/validations")
+        assert response.status_code == 200
+        assert response.json() == []
 
 
 class TestSSEStream:
@@ -101,6 +102,67 @@ class TestSSEStream:
         assert "/api/stream" in routes
 
 
+class TestSSEResume:
+    @staticmethod
+    def _open_stream(fs, since=0, last_event_id=None):
+        app = create_app(fs)
+        [route] = [r for r in app.routes if getattr(r, "path", None) == "/api/stream"]
+        return route.endpoint(since=since, last_event_id=last_event_id)
+
+    async def test_frames_carry_seq_and_skip_duplicates(self, fs):
+        response = await self._open_stream(fs)
+        stream = response.body_iterator
+        # Emitted after subscribing: in both the history and the queue
+        await fs.event_bus.emit("test", {"n": 1})
+        await fs.event_bus.emit("test", {"n": 2})
+
+        frame = await anext(stream)
+        assert frame["id"] == "2"
+        assert [e["data"]["n"] for e in json.loads(frame["data"])["events"]] == [1, 2]
+
+        await fs.event_bus.emit("test", {"n": 3})
+        frame = await asyncio.wait_for(anext(stream), timeout=1.0)
+        assert frame["id"] == "3"
+        assert json.loads(frame["data"])["data"] == {"n": 3}
+        await stream.aclose()
+        assert not fs.event_bus._subscribers
+
+    async def test_resume_replays_only_missed_events(self, fs):
+        for n in range(1, 5):
+            await fs.event_bus.emit("test", {"n": n})
+
+        for kwargs in ({"since": 2}, {"last_event_id": "2"}):
+            stream = (await self._open_stream(fs, **kwargs)).body_iterator
+            frame = await anext(stream)
+            assert [e["data"]["n"] for e in json.loads(frame["data"])["events"]] == [3, 4]
+            await stream.aclose()
+
+    async def test_stale_last_event_id_after_restart(self, fs):
+        # Fresh bus, but the client's id is from the previous server's sequence
+        stream = (await self._open_stream(fs, last_event_id="500")).body_iterator
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+
+        await fs.event_bus.emit("test", {"n": 1})
+        frame = await asyncio.wait_for(pending, timeout=1.0)
+        assert frame["id"] == "1"
+        assert json.loads(frame["data"])["data"] == {"n": 1}
+        await stream.aclose()
+
+    def test_recent_events_since_and_limit(self, fs):
+        async def _test():
+            for n in range(1, 11):
+                await fs.event_bus.emit("test", {"n": n})
+
+        asyncio.run(_test())
+        bus = fs.event_bus
+        assert [e.seq for e in bus.recent_events(since=7)] == [8, 9, 10]
+        assert [e.seq for e in bus.recent_events(limit=2, since=3)] == [9, 10]
+        assert bus.recent_events(since=10) == []
+        # A cursor from before a restart replays everything
+        assert len(bus.recent_events(since=99)) == 10
+
+
 class TestEventBus:
     def test_emit_and_history(self, fs):
         """EventBus stores emitted events in history."""
@@ -133,3 +195,144 @@ class TestEventBus:
             assert len(fs.event_bus._subscribers) == 0
 
         asyncio.run(_test())
+
+    def test_unsubscribe_is_idempotent(self, fs):
+        async def _test():
+            keep = fs.event_bus.subscribe()
+            gone = fs.event_bus.subscribe()
+            fs.event_bus.unsubscribe(gone)
+            fs.event_bus.unsubscribe(gone)
+            await fs.event_bus.emit("validation", {"passed": True})
+            assert fs.event_bus._subscribers == {keep}
+            assert keep.qsize() == 1 and gone.qsize() == 0
+
+        asyncio.run(_test())
+
+    def test_history_bounded(self, fs):
+        """Old events fall off once the history limit is reached."""
+        bus = fs.event_bus
+        bus._history = deque(maxlen=10)
+
+        async def _test():
+            for i in range(25):
+                await bus.emit("test", {"i": i})
+
+        asyncio.run(_test())
+        assert [e["data"]["i"] for e in bus._history] == list(range(15, 25))
+        assert [e["data"]["i"] for e in bus.history] == list(range(15, 25))
+
+    def test_history_returns_last_200(self, fs):
+        async def _test():
+            for i in range(250):
+                await fs.event_bus.emit("test", {"i": i})
+
+        asyncio.run(_test())
+        assert [e["data"]["i"] for e in fs.event_bus.history] == list(range(50, 250))
+
+    def test_history_snapshot_reused_until_emit(self, fs):
+        bus = fs.event_bus
+        asyncio.run(bus.emit("test", {"i": 0}))
+        first = bus.history
+        assert bus.history is first
+
+        asyncio.run(bus.emit("test", {"i": 1}))
+        assert bus.history is not first
+        assert [e["data"]["i"] for e in bus.history] == [0, 1]
+
+    def test_get_by_trace_returns_latest(self, fs):
+        async def _test():
+            await fs.event_bus.emit("validation", {"trace_id": "t1", "n": 1})
+            await fs.event_bus.emit("other", {"trace_id": "t1", "n": 2})
+            await fs.event_bus.emit("validation", {"trace_id": "t1", "n": 3})
+
+        asyncio.run(_test())
+        assert fs.event_bus.get_by_trace("t1")["data"]["n"] == 3
+        assert fs.event_bus.get_by_trace("missing") is None
+
+    def test_get_by_trace_forgets_evicted_events(self, fs):
+        bus = fs.event_bus
+        bus._history = deque(maxlen=2)
+
+        async def _test():
+            await bus.emit("validation", {"trace_id": "old"})
+            await bus.emit("validation", {"trace_id": "keep"})
+            await bus.emit("validation", {"trace_id": "keep"})
+
+        asyncio.run(_test())
+        assert bus.get_by_trace("old") is None
+        assert bus.get_by_trace("keep") is bus._history[-1]
+
+    def test_events_for_trace_drops_evicted_events(self, fs):
+        bus = fs.event_bus
+        bus._history = deque(maxlen=3)
+
+        async def _test():
+            for n in range(3):
+                await bus.emit("validation", {"trace_id": "t", "n": n})
+            await bus.emit("validation", {"trace_id": "u", "n": 3})
+
+        asyncio.run(_test())
+        assert [e["data"]["n"] for e in bus.events_for_trace("t")] == [1, 2]
+        assert [e["data"]["n"] for e in bus.events_for_trace("u")] == [3]
+        assert bus.events_for_trace("missing") == []
+
+    def test_no_history_without_listeners_skips_event(self):
+        fs = FailSafe(audit_db=":memory:", event_history=False)
+        assert not fs.event_bus.has_listeners()
+        fs._mask_sensitive = lambda *a: pytest.fail("event built without listeners")
+        fs.trace("a", "b", {"x": 1})
+        assert len(fs.event_bus._history) == 0
+
+    def test_no_history_still_delivers_to_subscribers(self):
+        fs = FailSafe(audit_db=":memory:", event_history=False)
+
+        async def _test():
+            queue = fs.event_bus.subscribe()
+            assert fs.event_bus.has_listeners()
+            await fs.handoff("a", "b", {"x": 1})
+            return queue.get_nowait()
+
+        event = asyncio.run(_test())
+        assert event["data"]["source"] == "a"
+        assert len(fs.event_bus._history) == 0
+
+
+class TestSSEFraming:
+    def test_single_event_sent_as_is(self, fs):
+        async def _test():
+            await fs.event_bus.emit("validation", {"passed": True})
+
+        asyncio.run(_test())
+        frame = json.loads(encode_events(fs.event_bus.history))
+        assert frame["type"] == "validation"
+
+    def test_multiple_events_batched(self, fs):
+        async def _test():
+            for i in range(3):
+                await fs.event_bus.emit("validation", {"i": i})
+
+        asyncio.run(_test())
+        frame = json.loads(encode_events(fs.event_bus.history))
+        assert [e["data"]["i"] for e in frame["events"]] == [0, 1, 2]
+
+    def test_event_encoding_cached(self, fs):
+        async def _test():
+            await fs.event_bus.emit("validation", {"passed": True})
+
+        asyncio.run(_test())
+        event = fs.event_bus.history[0]
+        assert event.to_json() is event.to_json()
+        assert json.loads(event.to_json()) == event
+        assert event.data_json() is event.data_json()
+        assert json.loads(event.data_json()) == {"passed": True}
+
+    def test_handoff_summary_cached(self, fs):
+        asyncio.run(fs.handoff("kyc_agent", "onboarding_agent", {"name": "A"}))
+        event = fs.event_bus.history[0]
+        assert event.handoff_json() is event.handoff_json()
+        summary = json.loads(event.handoff_json())
+        assert set(summary) == {
+            "source", "target", "passed", "payload", "payload_preview",
+            "payload_keys", "violations", "timestamp", "trace_id",
+        }
+        assert summary["trace_id"] == event["data"]["trace_id"]
@@ -478,6 +478,7 @@ class TestTraceId:
         assert len(matching) == 3
         sources = [e["data"]["source"] for e in matching]
         assert sources == ["a", "b", "c"]
+        assert fs.event_bus.events_for_trace(tid) == matching
 
     def test_different_trace_ids_are_separate(self, fs):
         """Handoffs without shared trace_ids are not grouped."""
@@ -738,9 +739,9 @@ class TestE2EPipelineDataFlow:
                          trace_id=tid)
 
         # All three events share the trace_id
-        pipeline_events = [e for e in fs.event_bus._history
-                           if e["data"].get("trace_id") == tid]
+        pipeline_events = fs.event_bus.events_for_trace(tid)
         assert len(pipeline_events) == 3
+        assert fs.event_bus.get_by_trace(tid) is pipeline_events[-1]
 
         # First handoff: fails (ssn denied)
         assert pipeline_events[0]["data"]["passed"] is False
@@ -817,8 +818,11 @@ class TestEventBusHistoryBehavior:
     """The frontend fetches history on connect — verify it's correct."""
 
     def test_history_preserves_order(self, fs):
-        for i in range(10):
-            asyncio.run(fs.handoff("a", "b", {"order": i}))
+        async def _driver():
+            for i in range(10):
+                await fs.handoff("a", "b", {"order": i})
+
+        asyncio.run(_driver())
         history = fs.event_bus._history
         orders = [e["data"]["payload"]["order"] for e in history]
         assert orders == list(range(10))
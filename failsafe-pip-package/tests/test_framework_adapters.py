@@ -1,6 +1,7 @@
 """Tests for framework auto-detection and adapter stubs."""
 
 import asyncio
+import sys
 import types
 
 import pytest
@@ -47,70 +48,57 @@ def _mock_span(agent_name="unknown", target_agent="unknown", data=None):
 # Auto-detection tests
 # ---------------------------------------------------------------------------
 
-class TestDetectFramework:
-    def test_detect_framework_returns_none_when_nothing_installed(self, monkeypatch):
-        import builtins
-        real_import = builtins.__import__
+@pytest.fixture(autouse=True)
+def _fresh_detection():
+    """Detection is cached; keep mocked imports from leaking across tests."""
+    _detect_framework.cache_clear()
+    yield
+    _detect_framework.cache_clear()
 
-        blocked = {
-            "langgraph", "langchain_core", "crewai", "autogen_agentchat", "agents",
-        }
 
-        def mock_import(name, *args, **kwargs):
-            if name in blocked:
-                raise ImportError(f"mocked: {name}")
-            return real_import(name, *args, **kwargs)
+def _fake_find_spec(monkeypatch, installed=()):
+    """Pretend only *installed* framework packages can be found."""
+    calls = []
 
-        monkeypatch.setattr(builtins, "__import__", mock_import)
-        assert _detect_framework() is None
+    def find_spec(name, *args, **kwargs):
+        calls.append(name)
+        return object() if name in installed else None
 
-    def test_detect_framework_returns_langchain_when_installed(self, monkeypatch):
-        import builtins
-        real_import = builtins.__import__
+    # failsafe.observe the attribute is the observe() function, not the module
+    module = sys.modules[_detect_framework.__module__]
+    monkeypatch.setattr(module, "find_spec", find_spec)
+    return calls
 
-        blocked = {"langgraph"}  # block langgraph so langchain wins
 
-        def mock_import(name, *args, **kwargs):
-            if name in blocked:
-                raise ImportError(f"mocked: {name}")
-            if name == "langchain_core":
-                return types.ModuleType("langchain_core")
-            return real_import(name, *args, **kwargs)
+class TestDetectFramework:
+    def test_detect_framework_returns_none_when_nothing_installed(self, monkeypatch):
+        _fake_find_spec(monkeypatch)
+        assert _detect_framework() is None
 
-        monkeypatch.setattr(builtins, "__import__", mock_import)
+    def test_detect_framework_returns_langchain_when_installed(self, monkeypatch):
+        # langgraph absent so langchain wins
+        _fake_find_spec(monkeypatch, installed={"langchain_core", "crewai"})
         assert _detect_framework() == "langchain"
 
-    def test_observe_auto_detects_langchain(self, monkeypatch):
-        import builtins
-        real_import = builtins.__import__
-
-        blocked = {"langgraph"}
+    def test_detect_framework_does_not_import(self, monkeypatch):
+        _fake_find_spec(monkeypatch, installed={"crewai"})
+        monkeypatch.delitem(sys.modules, "crewai", raising=False)
+        assert _detect_framework() == "crewai"
+        assert "crewai" not in sys.modules
 
-        def mock_import(name, *args, **kwargs):
-            if name in blocked:
-                raise ImportError(f"mocked: {name}")
-            if name == "langchain_core":
-                return types.ModuleType("langchain_core")
-            return real_import(name, *args, **kwargs)
+    def test_detect_framework_cached(self, monkeypatch):
+        first = _detect_framework()
+        calls = _fake_find_spec(monkeypatch, installed={"langgraph"})
+        assert _detect_framework() == first
+        assert calls == []
 
-        monkeypatch.setattr(builtins, "__import__", mock_import)
+    def test_observe_auto_detects_langchain(self, monkeypatch):
+        _fake_find_spec(monkeypatch, installed={"langchain_core"})
         result = observe(dashboard=False, print_url=False)
         assert isinstance(result, FailSafeCallbackHandler)
 
     def test_observe_falls_back_to_generic(self, monkeypatch):
-        import builtins
-        real_import = builtins.__import__
-
-        blocked = {
-            "langgraph", "langchain_core", "crewai", "autogen_agentchat", "agents",
-        }
-
-        def mock_import(name, *args, **kwargs):
-            if name in blocked:
-                raise ImportError(f"mocked: {name}")
-            return real_import(name, *args, **kwargs)
-
-        monkeypatch.setattr(builtins, "__import__", mock_import)
+        _fake_find_spec(monkeypatch)
         result = observe(dashboard=False, print_url=False)
         assert isinstance(result, FailSafeObserver)
 
@@ -137,6 +125,22 @@ class TestCrewAIAdapter:
         assert last["data"]["source"] == "agent_a"
         assert last["data"]["target"] == "agent_b"
 
+    def test_openai_trace_processor_mapping_span_data(self):
+        from types import MappingProxyType
+
+        fs = _make_fs()
+        fs.contract(name="a-to-b", source="agent_a", target="agent_b", deny=["secret"])
+        proc = FailSafeTraceProcessor(fs)
+
+        span = _mock_span(
+            agent_name="agent_a",
+            target_agent="agent_b",
+            data=MappingProxyType({"secret": "x"}),
+        )
+        proc.trace_processor(_mock_trace([span]))
+
+        assert [v.field for v in proc.violations] == ["secret"]
+
     def test_crewai_callback_catches_violations(self):
         fs = _make_fs()
         fs.contract(name="a-to-b", source="agent_a", target="agent_b", deny=["secret"])
@@ -180,6 +184,23 @@ class TestCrewAIAdapter:
         # Same agent twice — no trace should be emitted
         assert len(fs.event_bus._history) == 0
 
+    def test_crewai_callback_skips_same_agent_object(self):
+        class Agent:
+            def __str__(self):
+                # A fresh, equal string on every call
+                return "".join(["agent", "_a"])
+
+        fs = _make_fs()
+        cb = FailSafeCrewCallback(fs)
+        agent = Agent()
+
+        cb.step_callback(_mock_step_output(agent, {"x": 1}))
+        cb.step_callback(_mock_step_output(agent, {"x": 2}))
+        assert len(fs.event_bus._history) == 0
+
+        cb.step_callback(_mock_step_output("agent_b", {"x": 3}))
+        assert fs.event_bus._history[-1]["data"]["source"] == "agent_a"
+
 
 # ---------------------------------------------------------------------------
 # AutoGen adapter tests
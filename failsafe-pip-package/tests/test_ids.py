@@ -0,0 +1,45 @@
+"""Tests for trace ID generation."""
+
+from uuid import UUID
+
+from failsafe.core.ids import new_trace_id, uuid7
+from failsafe.core.models import HandoffPayload
+
+
+def test_uuid7_version_and_variant():
+    u = uuid7()
+    assert u.version == 7
+    assert u.variant == "specified in RFC 4122"
+
+
+def test_trace_ids_are_time_ordered():
+    ids = [new_trace_id() for _ in range(50)]
+    assert all(str(UUID(i)) == i for i in ids)
+    prefixes = [UUID(i).int >> 80 for i in ids]
+    assert prefixes == sorted(prefixes)
+    assert len(set(ids)) == len(ids)
+
+
+def test_handoff_payload_default_trace_id():
+    payload = HandoffPayload(source="a", target="b", data={})
+    assert UUID(payload.trace_id).version == 7
+    assert payload.timestamp.tzinfo is not None
+
+
+def test_ids_ordered_within_a_millisecond(monkeypatch):
+    from failsafe.core import ids
+
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+    batch = [new_trace_id() for _ in range(100)]
+    assert batch == sorted(batch)
+    assert len(set(batch)) == len(batch)
+    assert all(UUID(i).version == 7 for i in batch)
+    assert str(uuid7()) > batch[-1]
+
+
+def test_reseed_starts_new_sequence():
+    from failsafe.core import ids
+
+    before = new_trace_id()
+    ids._reseed()
+    assert new_trace_id()[15:] != before[15:]
@@ -239,3 +239,102 @@ async def test_handler_as_observe_integration(fs):
     assert s["tools_called"] == ["run_code"]
     assert len(s["handoffs"]) == 1
     assert repr(handler).startswith("<FailSafeCallbackHandler")
+
+
+@pytest.mark.asyncio
+async def test_summary_aggregates_in_first_seen_order(handler):
+    """summary() reports chains and tools in the order they were first seen."""
+    await handler.on_chain_start({"name": "outer"}, {})
+    await handler.on_tool_start({"name": "search"}, "q")
+    await handler.on_chain_start({"name": "inner"}, {})
+    await handler.on_tool_start({"name": "calc"}, "1+1")
+    await handler.on_tool_start({"name": "search"}, "q2")
+    await handler.on_chain_end({"r": 1})
+    await handler.on_chain_end({"r": 2})
+
+    s = handler.summary()
+    assert s["chains_seen"] == ["outer", "inner"]
+    assert s["tools_called"] == ["search", "calc"]
+    assert s["total_events"] == len(handler.audit_log)
+
+
+@pytest.mark.asyncio
+async def test_audit_log_bounded(fs):
+    """max_audit_events keeps only the most recent events."""
+    handler = FailSafeCallbackHandler(failsafe=fs, max_audit_events=3)
+    for i in range(5):
+        await handler.on_chain_start({"name": f"chain_{i}"}, {})
+
+    assert len(handler.audit_log) == 3
+    chains = [e["chain"] for e in handler.iter_events()]
+    assert chains == ["chain_2", "chain_3", "chain_4"]
+    # Aggregates still cover everything that was observed
+    assert len(handler.summary()["chains_seen"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_summary_handoffs_bounded(fs):
+    handler = FailSafeCallbackHandler(failsafe=fs, max_audit_events=3)
+    await handler.on_chain_start({"name": "outer"}, {})
+    for i in range(5):
+        await handler.on_chain_start({"name": f"step_{i}"}, {})
+        await handler.on_chain_end({"i": i})
+
+    handoffs = handler.summary()["handoffs"]
+    assert [h["target"] for h in handoffs] == ["step_2", "step_3", "step_4"]
+
+
+@pytest.mark.asyncio
+async def test_events_stamped_with_ns_and_formatted_in_summary(handler):
+    from datetime import datetime
+
+    await handler.on_chain_start({"name": "outer"}, {})
+    await handler.on_chain_start({"name": "inner"}, {})
+    await handler.on_chain_end({"result": "done"})
+
+    assert all(isinstance(e["ts_ns"], int) for e in handler.audit_log)
+    assert all("timestamp" not in e for e in handler.audit_log)
+
+    handoff = handler.summary()["handoffs"][0]
+    parsed = datetime.fromisoformat(handoff["timestamp"])
+    assert parsed.utcoffset().total_seconds() == 0
+    assert abs(parsed.timestamp() - handoff["ts_ns"] / 1e9) < 1e-3
+
+
+@pytest.mark.asyncio
+async def test_tool_attributed_to_enclosing_chain_after_nested_end(handler):
+    await handler.on_chain_start({"name": "outer"}, {})
+    await handler.on_chain_start({"name": "inner"}, {})
+    await handler.on_chain_end({})
+    await handler.on_tool_start({"name": "search"}, "q")
+    await handler.on_chain_end({})
+    await handler.on_tool_start({"name": "search"}, "q")
+
+    agents = [e["agent"] for e in handler.audit_log if e["event"] == "tool_start"]
+    assert agents == ["outer", "unknown"]
+
+
+@pytest.mark.asyncio
+async def test_trivial_handoffs_not_validated(fs, handler):
+    await handler.on_chain_start({"name": "outer"}, {})
+    await handler.on_chain_start({"name": "inner"}, {})
+    await handler.on_chain_end({})
+    await handler.on_chain_start({"name": "outer"}, {})
+    await handler.on_chain_end({"x": 1})
+    await handler.on_chain_end({"x": 1})
+
+    assert handler.summary()["handoffs"] == []
+    assert [e["event"] for e in handler.audit_log].count("chain_end") == 3
+    assert len(fs.event_bus._history) == 0
+
+
+@pytest.mark.asyncio
+async def test_empty_output_on_contracted_edge_validated(fs, handler):
+    fs.contract("needs-result", "outer", "inner", require=["result"])
+    await handler.on_chain_start({"name": "outer"}, {})
+    await handler.on_chain_start({"name": "inner"}, {})
+    await handler.on_chain_end({})
+
+    [handoff] = handler.summary()["handoffs"]
+    assert handoff["passed"] is False
+    assert [v.rule for v in handler.violations] == ["require_fields"]
@@ -113,3 +113,156 @@ async def test_multiple_rules(judge, payload):
     assert len(violations) == 2
     assert violations[0].severity == "critical"
     assert violations[1].severity == "medium"
+
+
+@pytest.mark.asyncio
+async def test_handoff_merges_llm_violations():
+    from failsafe import FailSafe
+
+    fs = FailSafe(audit_db=":memory:", cerebras_api_key="test-key")
+    fs.contract(
+        name="c", source="a", target="b", deny=["secret"], nl_rules=["Rule 1"]
+    )
+    evaluations = [{"rule": "Rule 1", "passed": False, "reason": "no", "severity": "high"}]
+    mock_post = AsyncMock(return_value=FakeResponse(evaluations))
+    with patch("httpx.AsyncClient.post", mock_post):
+        result = await fs.handoff("a", "b", {"secret": 1})
+    assert result.validation_mode == "both"
+    assert [v.rule for v in result.violations] == ["deny_fields", "nl_rule: Rule 1"]
+
+
+@pytest.mark.asyncio
+async def test_handoff_survives_llm_failure():
+    from failsafe import FailSafe
+
+    fs = FailSafe(audit_db=":memory:", cerebras_api_key="test-key")
+    fs.contract(name="c", source="a", target="b", deny=["secret"], nl_rules=["Rule 1"])
+    with patch("httpx.AsyncClient.post", AsyncMock(side_effect=RuntimeError("down"))):
+        result = await fs.handoff("a", "b", {"secret": 1})
+    assert result.validation_mode == "deterministic"
+    assert len(result.violations) == 1
+
+
+class FakeBatchResponse(FakeResponse):
+    def __init__(self, results):
+        super().__init__([])
+        self._data["choices"][0]["message"]["content"] = json.dumps({"results": results})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_call():
+    import asyncio
+
+    judge = LLMJudge(api_key="test-key", max_batch_size=8, max_latency_ms=10)
+    a = HandoffPayload(source="a", target="b", data={"x": 1})
+    b = HandoffPayload(source="c", target="d", data={"y": 2})
+    results = [
+        {"index": 0, "evaluations": [{"rule": "R1", "passed": True}]},
+        {"index": 1, "evaluations": [{"rule": "R2", "passed": False, "reason": "bad", "severity": "high"}]},
+    ]
+    mock_post = AsyncMock(return_value=FakeBatchResponse(results))
+    with patch("httpx.AsyncClient.post", mock_post):
+        va, vb = await asyncio.gather(judge.submit(a, ["R1"]), judge.submit(b, ["R2"]))
+    assert mock_post.await_count == 1
+    assert va == []
+    assert len(vb) == 1 and vb[0].source_agent == "c"
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_dispatch():
+    import asyncio
+
+    judge = LLMJudge(api_key="test-key", max_batch_size=2, max_latency_ms=60_000)
+    payloads = [HandoffPayload(source="a", target="b", data={"i": i}) for i in range(2)]
+    results = [{"index": i, "evaluations": []} for i in range(2)]
+    with patch("httpx.AsyncClient.post", AsyncMock(return_value=FakeBatchResponse(results))):
+        out = await asyncio.wait_for(
+            asyncio.gather(*(judge.submit(p, ["R"]) for p in payloads)), timeout=5
+        )
+    assert out == [[], []]
+
+
+@pytest.mark.asyncio
+async def test_batching_off_by_default():
+    import asyncio
+
+    judge = LLMJudge(api_key="test-key")
+    payloads = [HandoffPayload(source="a", target="b", data={"i": i}) for i in range(2)]
+    mock_post = AsyncMock(return_value=FakeResponse([]))
+    with patch("httpx.AsyncClient.post", mock_post):
+        await asyncio.gather(*(judge.submit(p, ["R"]) for p in payloads))
+    assert mock_post.await_count == 2
+    assert not judge.batcher._pending
+
+
+@pytest.mark.asyncio
+async def test_missing_batch_result_is_retried_alone():
+    import asyncio
+
+    judge = LLMJudge(api_key="test-key", max_batch_size=8, max_latency_ms=10)
+    a = HandoffPayload(source="a", target="b", data={"x": 1})
+    b = HandoffPayload(source="c", target="d", data={"y": 2})
+    single = [{"rule": "R2", "passed": False, "reason": "bad", "severity": "low"}]
+    mock_post = AsyncMock(side_effect=[
+        FakeBatchResponse([{"index": 0, "evaluations": []}]),
+        FakeResponse(single),
+    ])
+    with patch("httpx.AsyncClient.post", mock_post):
+        va, vb = await asyncio.gather(judge.submit(a, ["R1"]), judge.submit(b, ["R2"]))
+    assert mock_post.await_count == 2
+    assert va == [] and vb[0].severity == "low"
+
+
+@pytest.mark.asyncio
+async def test_offloaded_stages_overlap_llm_judge():
+    import asyncio
+    import time
+
+    from failsafe import FailSafe
+
+    def slow_rule(payload):
+        time.sleep(0.2)
+        return True
+
+    async def slow_post(*args, **kwargs):
+        await asyncio.sleep(0.2)
+        return FakeResponse([{"rule": "Rule 1", "passed": True, "reason": "ok", "severity": "low"}])
+
+    fs = FailSafe(
+        audit_db=":memory:", cerebras_api_key="test-key", offload_validation=True
+    )
+    fs.contract(
+        name="c", source="a", target="b",
+        rules=[{"type": "custom", "func": slow_rule}], nl_rules=["Rule 1"],
+    )
+    with patch("httpx.AsyncClient.post", side_effect=slow_post):
+        start = time.perf_counter()
+        result = await fs.handoff("a", "b", {"x": 1})
+        elapsed = time.perf_counter() - start
+    assert result.passed
+    assert result.validation_mode == "both"
+    # Sequential would be >= 0.4s
+    assert elapsed < 0.35
+
+
+@pytest.mark.asyncio
+async def test_local_stages_stay_inline_with_llm_judge():
+    import threading
+
+    from failsafe import FailSafe
+
+    threads = []
+
+    def rule(payload):
+        threads.append(threading.current_thread())
+        return True
+
+    fs = FailSafe(audit_db=":memory:", cerebras_api_key="test-key")
+    fs.contract(
+        name="c", source="a", target="b",
+        rules=[{"type": "custom", "func": rule}], nl_rules=["Rule 1"],
+    )
+    with patch("httpx.AsyncClient.post", AsyncMock(return_value=FakeResponse([]))):
+        result = await fs.handoff("a", "b", {"x": 1})
+    assert result.validation_mode == "both"
+    assert threads == [threading.current_thread()]
@@ -0,0 +1,63 @@
+"""Tests for sensitive-value masking."""
+
+import pytest
+
+from failsafe.core.masking import MASK, SENSITIVE_KEYS, mask_sensitive
+from failsafe.core.serialization import dumps
+
+
+def test_key_variants_masked():
+    result = mask_sensitive({"API-Key": "k", "Secret_Key": "s", "name": "Bob"})
+    assert result == {"API-Key": MASK, "Secret_Key": MASK, "name": "Bob"}
+
+
+def test_values_masked_in_lists():
+    result = mask_sensitive({"rows": ["123-45-6789", "4111 1111 1111 1111"]})
+    assert result == {"rows": ["***-**-****", "****-****-****-****"]}
+
+
+def test_digit_free_strings_returned_as_is():
+    text = "<b>日本語</b> no numbers here"
+    assert mask_sensitive({"ssn_note": text})["ssn_note"] is text
+    assert mask_sensitive({"n": "١٢٣-٤٥-٦٧٨٩"})["n"] == "***-**-****"
+
+
+def test_input_not_mutated():
+    payload = {"user": {"ssn": "123-45-6789"}}
+    mask_sensitive(payload)
+    assert payload == {"user": {"ssn": "123-45-6789"}}
+
+
+@pytest.mark.parametrize("payload", [
+    {"Password": "x"},
+    {"nested": [{"TOKEN": "t"}]},
+    {"notes": "line\n123-45-6789"},
+    {"näme": "4111-1111-1111-1111"},
+    *({key: "v"} for key in sorted(SENSITIVE_KEYS)),
+])
+def test_raw_screen_never_skips_masking(payload):
+    assert mask_sensitive(payload, dumps(payload)) == mask_sensitive(payload)
+    assert mask_sensitive(payload, dumps(payload)) != payload
+
+
+def test_clean_payload_containers_copied():
+    payload = {"name": "Bob", "items": [1, 2], "user": {"id": "u1"}}
+    result = mask_sensitive(payload, dumps(payload))
+    assert result == payload
+    assert result is not payload
+    assert result["items"] is not payload["items"]
+    assert result["user"] is not payload["user"]
+
+
+def test_history_unaffected_by_later_payload_changes():
+    from failsafe.core.engine import FailSafe
+
+    fs = FailSafe(audit_db=":memory:")
+    state = {"user": {"name": "alice"}, "notes": ["ok"]}
+    fs.trace("a", "b", state)
+    # e.g. a reused LangGraph state dict filled in by a later step
+    state["user"]["ssn"] = "123-45-6789"
+    state["notes"].append("card 4111 1111 1111 1111")
+
+    payload = fs.event_bus.history[-1]["data"]["payload"]
+    assert payload == {"user": {"name": "alice"}, "notes": ["ok"]}
@@ -84,6 +84,30 @@ class TestObserverTrace:
         observer.trace("a", "b", {"secret": "y"})
         assert len(observer.violations) >= 2
 
+    def test_violations_scanned_incrementally(self, observer):
+        from collections import deque
+
+        observer.fs.contract(name="a-to-b", source="a", target="b", deny=["secret"])
+        observer.fs.event_bus._history = deque(maxlen=2)
+        observer.trace("a", "b", {"secret": "x"})
+        assert len(observer.violations) == 1
+        for _ in range(3):
+            observer.trace("a", "b", {"secret": "y"})
+        # Earlier violations survive eviction; unread evicted events are lost
+        assert len(observer.violations) == 3
+        assert len(observer.violations) == 3
+
+    def test_violations_capped_like_history(self, fs):
+        from collections import deque
+
+        fs.contract(name="a-to-b", source="a", target="b", deny=["secret"])
+        fs.event_bus._history = deque(maxlen=2)
+        observer = FailSafeObserver(fs)
+        for value in "xyz":
+            observer.trace("a", "b", {"secret": value})
+            observer.violations
+        assert len(observer.violations) == 2
+
     def test_audit_log_property(self, observer):
         observer.trace("a", "b", {"key": "val"})
         log = observer.audit_log
@@ -237,3 +261,78 @@ class TestFsTraceMethod:
         result_handoff = fs.handoff_sync("a", "b", {"secret": "x", "ok": "y"})
         assert result_trace.passed == result_handoff.passed
         assert len(result_trace.violations) == len(result_handoff.violations)
+
+
+class TestHandoffSync:
+    def test_handoff_sync_inside_running_loop(self, fs):
+        async def run():
+            return fs.handoff_sync("a", "b", {"x": 1})
+
+        assert isinstance(asyncio.run(run()), ValidationResult)
+
+    def test_handoff_sync_reuses_one_loop(self, fs):
+        fs.trace("a", "b", {"x": 1})
+        fs.trace("a", "b", {"x": 2})
+        loops = list(fs.audit_log._conns)
+        assert len(loops) == 1
+
+    def test_trace_then_query(self, fs):
+        fs.audit_log.flush_interval = 60
+        fs.trace("a", "b", {"x": 1})
+        # query() runs on a different loop than the background one
+        rows = asyncio.run(fs.audit_log.query())
+        assert len(rows) == 1
+
+    def test_handoff_sync_records_written_at_exit(self, tmp_path):
+        import sqlite3
+        import subprocess
+        import sys
+
+        db = tmp_path / "audit.db"
+        script = (
+            "from failsafe.core.engine import FailSafe\n"
+            f"fs = FailSafe(audit_db={str(db)!r})\n"
+            "fs.audit_log.flush_interval = 60\n"
+            "for i in range(3):\n"
+            "    fs.trace('a', 'b', {'i': i})\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+        with sqlite3.connect(db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM handoffs").fetchone()[0] == 3
+
+
+class TestOffloadValidation:
+    def test_offloaded_results_match_inline(self):
+        results = []
+        for offload in (False, True):
+            fs = FailSafe(audit_db=":memory:", policy_pack="finance", offload_validation=offload)
+            fs.contract(name="c", source="a", target="b", deny=["secret"])
+            results.append(fs.trace("a", "b", {"secret": "x", "ssn": "123-45-6789"}))
+        inline, offloaded = results
+        assert [v.rule for v in inline.violations] == [v.rule for v in offloaded.violations]
+        assert inline.violations
+
+    def test_offloaded_runs_off_loop_thread(self):
+        import threading
+
+        fs = FailSafe(audit_db=":memory:", offload_validation=True)
+        fs.contract(name="c", source="a", target="b", allow=["x"])
+        seen = []
+        original = fs.policy_engine.evaluate
+        fs.policy_engine.evaluate = lambda p: seen.append(threading.get_ident()) or original(p)
+
+        async def run():
+            await fs.handoff("a", "b", {"x": 1})
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+        assert seen and seen[0] != loop_thread
+
+    def test_unchecked_edge_skips_stages(self):
+        for offload in (False, True):
+            fs = FailSafe(audit_db=":memory:", offload_validation=offload)
+            fs.policy_engine.evaluate = lambda p: pytest.fail("no policies loaded")
+            fs.validator.validate = lambda p, c: pytest.fail("no contract")
+            result = fs.trace("a", "b", {"x": 1})
+            assert result.passed
+            assert fs.event_bus._history[-1]["data"]["passed"] is True
@@ -1,6 +1,7 @@
 """Tests for payload visibility — event bus enrichment, masking, and dashboard endpoints."""
 
 import asyncio
+import json
 
 import httpx
 import pytest
@@ -56,6 +57,14 @@ class TestPayloadInEventBus:
         assert preview.endswith("...")
         assert len(preview) <= 203  # 200 + "..."
 
+    def test_event_timestamp_matches_handoff(self, fs):
+        from datetime import datetime
+
+        fs.trace("a", "b", {"name": "alice"})
+        event = fs.event_bus._history[-1]
+        assert event["timestamp"] == event["data"]["timestamp"]
+        assert datetime.fromisoformat(event["timestamp"]).utcoffset() is not None
+
 
 # ---------------------------------------------------------------------------
 # Masking tests
@@ -84,6 +93,27 @@ class TestMaskSensitive:
         assert "4111" not in result["info"]
         assert "****-****-****-****" in result["info"]
 
+    def test_mask_sensitive_ssn_and_card_in_same_value(self, fs):
+        result = fs._mask_sensitive(
+            {"notes": "ssn 123-45-6789, card 4111 1111 1111 1111"}
+        )
+        assert result["notes"] == "ssn ***-**-****, card ****-****-****-****"
+
+    def test_mask_with_raw_skips_clean_payload(self, fs):
+        payload = {"name": "Alice", "tags": ["a", "b"]}
+        result = fs._mask_sensitive(payload, json.dumps(payload))
+        assert result == payload
+        assert result is not payload
+
+    def test_mask_with_raw_still_masks(self, fs):
+        for payload in (
+            {"user": {"API-Key": "abc"}},
+            {"notes": "line\n123-45-6789"},
+            {"notes": "caf\u00e9 \u0661\u0662\u0663-\u0664\u0665-\u0666\u0667\u0668\u0669"},
+        ):
+            assert fs._mask_sensitive(payload, json.dumps(payload)) == fs._mask_sensitive(payload)
+            assert fs._mask_sensitive(payload) != payload
+
     def test_mask_preserves_safe_values(self, fs):
         result = fs._mask_sensitive({"name": "Alice", "age": 30})
         assert result == {"name": "Alice", "age": 30}
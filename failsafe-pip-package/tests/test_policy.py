@@ -60,6 +60,28 @@ class TestPolicyEngine:
         violations = self.engine.evaluate(make_payload())
         assert len(violations) == 0
 
+    def test_packs_evaluated_in_load_order(self):
+        from failsafe.core.models import Violation
+
+        def always(rule):
+            return Policy(
+                name=rule,
+                description=rule,
+                condition=lambda p: True,
+                check=lambda p: Violation(rule=rule, message=rule),
+            )
+
+        def broken(p):
+            raise ValueError("boom")
+
+        self.engine.load_pack(PolicyPack(name="one", policies=[always("r1"), always("r2")]))
+        self.engine.load_pack(PolicyPack(name="two", policies=[
+            Policy(name="bad", description="", condition=lambda p: True, check=broken),
+            always("r3"),
+        ]))
+        violations = self.engine.evaluate(make_payload())
+        assert [v.rule for v in violations] == ["r1", "r2", "r3"]
+
 
 class TestFinancePack:
     def setup_method(self):
@@ -97,6 +119,37 @@ class TestFinancePack:
         violations = self.engine.evaluate(payload)
         assert any(v.rule == "pii_isolation" for v in violations)
 
+    def test_pii_field_skips_pattern_scan(self, monkeypatch):
+        import failsafe.policies.finance as finance
+
+        def fail(data):
+            raise AssertionError("pattern scan should be skipped")
+
+        monkeypatch.setattr(finance, "_scan_text_for_patterns", fail)
+        payload = make_payload(data={"ssn": "123-45-6789", "note": "12345678901"})
+        [v] = [v for v in self.engine.evaluate(payload) if v.rule == "pii_isolation"]
+        assert v.evidence == {"pii_fields": ["ssn"], "patterns": []}
+
+    def test_pii_leakage_in_nested_list(self):
+        payload = make_payload(data={"rows": [{"memo": "acct 123456789012"}]})
+        violations = self.engine.evaluate(payload)
+        assert any(v.rule == "pii_isolation" for v in violations)
+
+    def test_pii_patterns_reported_once(self):
+        from failsafe.policies.finance import _scan_text_for_patterns
+
+        data = {
+            "a": "123-45-6789 and 987-65-4321",
+            "b": {"c": ["12345678901", "123-45-6789"]},
+        }
+        assert _scan_text_for_patterns(data) == ["account_number", "ssn"]
+
+    def test_pii_patterns_do_not_span_values(self):
+        from failsafe.policies.finance import _scan_text_for_patterns
+
+        assert _scan_text_for_patterns({"a": "1234", "b": "5678"}) == []
+        assert _scan_text_for_patterns({"a": "123-45", "b": "-6789"}) == []
+
     def test_no_pii_passes(self):
         payload = make_payload(data={"name": "Alice", "status": "verified"})
         violations = self.engine.evaluate(payload)
@@ -114,6 +167,11 @@ class TestFinancePack:
         violations = self.engine.evaluate(payload)
         assert not any(v.rule == "gdpr_tagging" for v in violations)
 
+    def test_gdpr_eu_detection_is_case_insensitive(self):
+        for data in ({"country": "de"}, {"region": "eu"}, {"country": "US", "region": "EU"}):
+            violations = self.engine.evaluate(make_payload(data=data))
+            assert any(v.rule == "gdpr_tagging" for v in violations), data
+
     def test_non_eu_data_no_gdpr_needed(self):
         payload = make_payload(data={"name": "John", "country": "US"})
         violations = self.engine.evaluate(payload)
@@ -0,0 +1,45 @@
+"""Tests for the JSON encoding helpers."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from failsafe.core import serialization
+from failsafe.core.serialization import dumps
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_roundtrip(backend):
+    payload = {"name": "Zoë", "n": [1, 2.5, None, True], "nested": {"a": "b"}}
+    assert json.loads(dumps(payload)) == payload
+
+
+def test_compact_output(backend):
+    assert dumps({"a": [1, 2], "b": None}) == '{"a":[1,2],"b":null}'
+    assert dumps({"n": 2**70, "m": [1]}) == '{"n":%d,"m":[1]}' % 2**70
+
+
+def test_non_str_keys(backend):
+    assert json.loads(dumps({1: "a"})) == {"1": "a"}
+
+
+def test_unknown_types_fall_back_to_str(backend):
+    class Thing:
+        def __str__(self):
+            return "thing"
+
+    assert json.loads(dumps({"t": Thing()})) == {"t": "thing"}
+    assert "2024" in json.loads(dumps({"d": datetime(2024, 1, 1)}))["d"]
+
+
+def test_big_int(backend):
+    assert json.loads(dumps({"n": 2**70})) == {"n": 2**70}
@@ -2,7 +2,7 @@
 
 import pytest
 
-from failsafe.core.models import Contract, ContractRule, HandoffPayload
+from failsafe.core.models import Contract, ContractRule, HandoffPayload, Violation
 from failsafe.core.validator import DeterministicValidator
 
 
@@ -82,6 +82,29 @@ class TestDenyFields:
         result = self.validator.validate(payload, contract)
         assert not result.passed
 
+    def test_undotted_name_matches_top_level_only(self):
+        contract = make_contract(
+            [ContractRule(rule_type="deny_fields", config={"fields": ["ssn", "x.y"], "scan_values": False})]
+        )
+        nested = make_payload(data={"personal": {"ssn": "1"}})
+        assert self.validator.validate(nested, contract).passed
+        both = make_payload(data={"ssn": "1", "x": {"y": 2}})
+        result = self.validator.validate(both, contract)
+        assert result.violations[0].field == "ssn, x.y"
+
+    def test_multiple_patterns_scanned(self):
+        contract = make_contract(
+            [
+                ContractRule(
+                    rule_type="deny_fields",
+                    config={"fields": [], "patterns": ["unknown", "ssn", "credit_card"]},
+                )
+            ]
+        )
+        payload = make_payload(data={"rows": [{"card": "4111 1111 1111 1111"}]})
+        result = self.validator.validate(payload, contract)
+        assert result.violations[0].evidence == {"pattern": "credit_card"}
+
 
 class TestRequireFields:
     def setup_method(self):
@@ -228,3 +251,13 @@ class TestSanitization:
         result = self.validator.validate(payload, contract)
         assert "ssn" not in result.sanitized_payload
         assert "name" in result.sanitized_payload
+
+    def test_sanitize_drops_fields_from_all_violations(self):
+        violations = [
+            Violation(rule="deny_fields", message="m", field="ssn, token"),
+            Violation(rule="require_fields", message="m"),
+            Violation(rule="deny_fields", message="m", field="ssn"),
+        ]
+        data = {"name": "Alice", "ssn": "x", "token": "y", "age": 3}
+        assert self.validator._sanitize(data, violations) == {"name": "Alice", "age": 3}
+        assert list(self.validator._sanitize(data, violations)) == ["name", "age"]